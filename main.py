@@ -6,12 +6,15 @@ YouTube, TikTok, Instagram 플랫폼의 트렌드와 키워드를 조사하는 A
 from fastapi import FastAPI, HTTPException, Query, Request, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import StreamingResponse
 from fastapi.responses import RedirectResponse
+from fastapi.responses import Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
+import asyncio
 from dotenv import load_dotenv
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -41,7 +44,8 @@ app = FastAPI(
     description="YouTube, TikTok, Instagram의 트렌드와 키워드를 조사하는 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # 목록 응답이 많으므로 orjson으로 직렬화
 )
 
 # CORS 미들웨어 설정
@@ -64,6 +68,18 @@ google_trends_service = GoogleTrendsService()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+@app.on_event("shutdown")
+async def close_http_sessions():
+    """서버 종료 시 서비스별 공유 HTTP 세션 정리"""
+    await asyncio.gather(
+        youtube_service.close(),
+        tiktok_service.close(),
+        instagram_service.close(),
+        age_analysis_service.youtube_service.close(),
+        age_analysis_service.tiktok_service.close(),
+        age_analysis_service.instagram_service.close(),
+    )
+
 @app.get("/", include_in_schema=False)
 async def root_redirect():
     """루트 접근 시 웹 대시보드로 리다이렉트"""
@@ -115,6 +131,10 @@ async def analyze_youtube(req: YouTubeAnalyzeRequest):
     """YouTube 분석: 채널/키워드, 기간/폼/임계치 필터 적용"""
     try:
         result = await youtube_service.analyze(req)
+        if isinstance(result, YouTubeAnalyzeResponse):
+            # 서비스가 만든 응답 모델은 response_model로 다시 검증/변환하지 않고 바로 JSON 직렬화
+            # (행이 수천 개일 때 재검증과 jsonable_encoder 변환 비용이 직렬화보다 크다)
+            return Response(content=result.model_dump_json(), media_type="application/json")
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"YouTube 분석 실패: {str(e)}")
@@ -400,14 +420,15 @@ async def compare_age_groups(
 ):
     """연령대별 키워드 비교 분석 - 여러 키워드의 연령대별 인기도 비교"""
     try:
-        comparison_results = {}
-        
-        for keyword in keywords:
-            result = await age_analysis_service.analyze_specific_keyword(
+        # 키워드별 분석을 동시에 실행
+        results = await asyncio.gather(*(
+            age_analysis_service.analyze_specific_keyword(
                 keyword=keyword,
                 platforms=platforms
             )
-            comparison_results[keyword] = result
+            for keyword in keywords
+        ))
+        comparison_results = dict(zip(keywords, results))
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -431,16 +452,20 @@ async def get_global_trends(
 ):
     """모든 플랫폼의 트렌드 통합 조회"""
     try:
-        global_trends = {}
+        tasks = {}
         
         if "youtube" in platforms:
-            global_trends["youtube"] = await youtube_service.get_trending_videos(max_results=max_results)
+            tasks["youtube"] = youtube_service.get_trending_videos(max_results=max_results)
         
         if "tiktok" in platforms:
-            global_trends["tiktok"] = await tiktok_service.get_trending_videos(max_results=max_results)
+            tasks["tiktok"] = tiktok_service.get_trending_videos(max_results=max_results)
         
         if "instagram" in platforms:
-            global_trends["instagram"] = await instagram_service.get_trending_posts(max_results=max_results)
+            tasks["instagram"] = instagram_service.get_trending_posts(max_results=max_results)
+        
+        # 플랫폼별 조회를 동시에 실행
+        results = await asyncio.gather(*tasks.values())
+        global_trends = dict(zip(tasks.keys(), results))
         
         return global_trends
     except Exception as e:
@@ -454,16 +479,20 @@ async def search_global(
 ):
     """모든 플랫폼에서 통합 검색"""
     try:
-        global_search = {}
+        tasks = {}
         
         if "youtube" in platforms:
-            global_search["youtube"] = await youtube_service.search_videos(query=query, max_results=max_results)
+            tasks["youtube"] = youtube_service.search_videos(query=query, max_results=max_results)
         
         if "tiktok" in platforms:
-            global_search["tiktok"] = await tiktok_service.search_videos(query=query, max_results=max_results)
+            tasks["tiktok"] = tiktok_service.search_videos(query=query, max_results=max_results)
         
         if "instagram" in platforms:
-            global_search["instagram"] = await instagram_service.search_posts(query=query, max_results=max_results)
+            tasks["instagram"] = instagram_service.search_posts(query=query, max_results=max_results)
+        
+        # 플랫폼별 검색을 동시에 실행
+        results = await asyncio.gather(*tasks.values())
+        global_search = dict(zip(tasks.keys(), results))
         
         return global_search
     except Exception as e:
@@ -476,18 +505,16 @@ async def get_realtime_trends(
 ):
     """실시간 인기 검색어 및 트렌딩 동영상 조회"""
     try:
-        # YouTube 실시간 트렌딩 동영상 조회
-        youtube_trends = await youtube_service.get_trending_videos(
-            region_code=region_code,
-            max_results=max_results
+        # YouTube/TikTok/Instagram 실시간 트렌딩 콘텐츠 동시 조회
+        youtube_trends, tiktok_trends, instagram_trends = await asyncio.gather(
+            youtube_service.get_trending_videos(
+                region_code=region_code,
+                max_results=max_results
+            ),
+            tiktok_service.get_trending_videos(max_results=max_results),
+            instagram_service.get_trending_posts(max_results=max_results),
         )
         
-        # TikTok 실시간 트렌딩 동영상 조회
-        tiktok_trends = await tiktok_service.get_trending_videos(max_results=max_results)
-        
-        # Instagram 실시간 트렌딩 게시물 조회
-        instagram_trends = await instagram_service.get_trending_posts(max_results=max_results)
-        
         # 실시간 인기 검색어 추출 (해시태그 기반)
         trending_keywords = await extract_trending_keywords(youtube_trends, tiktok_trends, instagram_trends)
         
@@ -509,10 +536,12 @@ async def get_trending_keywords(
 ):
     """실시간 인기 검색어만 조회"""
     try:
-        # 각 플랫폼의 트렌딩 콘텐츠 조회
-        youtube_trends = await youtube_service.get_trending_videos(max_results=50)
-        tiktok_trends = await tiktok_service.get_trending_videos(max_results=50)
-        instagram_trends = await instagram_service.get_trending_posts(max_results=50)
+        # 각 플랫폼의 트렌딩 콘텐츠 동시 조회
+        youtube_trends, tiktok_trends, instagram_trends = await asyncio.gather(
+            youtube_service.get_trending_videos(max_results=50),
+            tiktok_service.get_trending_videos(max_results=50),
+            instagram_service.get_trending_posts(max_results=50),
+        )
         
         # 인기 검색어 추출
         trending_keywords = await extract_trending_keywords(youtube_trends, tiktok_trends, instagram_trends)
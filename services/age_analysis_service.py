@@ -350,27 +350,29 @@ class AgeAnalysisService:
     ) -> List[Dict[str, Any]]:
         """플랫폼별 트렌드 데이터 수집"""
         all_trends = []
+        fetchers = {
+            "youtube": lambda: self.youtube_service.get_trending_videos(max_results=max_results),
+            "tiktok": lambda: self.tiktok_service.get_trending_videos(max_results=max_results),
+            "instagram": lambda: self.instagram_service.get_trending_posts(max_results=max_results),
+        }
+        targets = [platform for platform in platforms if platform in fetchers]
         
-        for platform in platforms:
-            try:
-                if platform == "youtube":
-                    trends = await self.youtube_service.get_trending_videos(max_results=max_results)
-                elif platform == "tiktok":
-                    trends = await self.tiktok_service.get_trending_videos(max_results=max_results)
-                elif platform == "instagram":
-                    trends = await self.instagram_service.get_trending_posts(max_results=max_results)
-                else:
-                    continue
-                
-                # 플랫폼 정보 추가
-                for trend in trends:
-                    trend_dict = trend.dict() if hasattr(trend, 'dict') else trend
-                    trend_dict['platform'] = platform
-                    all_trends.append(trend_dict)
-                    
-            except Exception as e:
-                print(f"{platform} 트렌드 수집 실패: {str(e)}")
+        # 플랫폼별 조회를 동시에 실행 (실패한 플랫폼은 건너뜀)
+        results = await asyncio.gather(
+            *(fetchers[platform]() for platform in targets),
+            return_exceptions=True
+        )
+        
+        for platform, trends in zip(targets, results):
+            if isinstance(trends, Exception):
+                print(f"{platform} 트렌드 수집 실패: {str(trends)}")
                 continue
+            
+            # 플랫폼 정보 추가
+            for trend in trends:
+                trend_dict = trend.dict() if hasattr(trend, 'dict') else trend
+                trend_dict['platform'] = platform
+                all_trends.append(trend_dict)
         
         return all_trends
 
@@ -476,27 +478,29 @@ class AgeAnalysisService:
     ) -> List[Dict[str, Any]]:
         """플랫폼별 키워드 검색"""
         search_results = []
+        searchers = {
+            "youtube": lambda: self.youtube_service.search_videos(query=keyword, max_results=20),
+            "tiktok": lambda: self.tiktok_service.search_videos(query=keyword, max_results=20),
+            "instagram": lambda: self.instagram_service.search_posts(query=keyword, max_results=20),
+        }
+        targets = [platform for platform in platforms if platform in searchers]
         
-        for platform in platforms:
-            try:
-                if platform == "youtube":
-                    results = await self.youtube_service.search_videos(query=keyword, max_results=20)
-                elif platform == "tiktok":
-                    results = await self.tiktok_service.search_videos(query=keyword, max_results=20)
-                elif platform == "instagram":
-                    results = await self.instagram_service.search_posts(query=keyword, max_results=20)
-                else:
-                    continue
-                
-                # 플랫폼 정보 추가
-                for result in results:
-                    result_dict = result.dict() if hasattr(result, 'dict') else result
-                    result_dict['platform'] = platform
-                    search_results.append(result_dict)
-                    
-            except Exception as e:
-                print(f"{platform} 키워드 검색 실패: {str(e)}")
+        # 플랫폼별 검색을 동시에 실행 (실패한 플랫폼은 건너뜀)
+        results_by_platform = await asyncio.gather(
+            *(searchers[platform]() for platform in targets),
+            return_exceptions=True
+        )
+        
+        for platform, results in zip(targets, results_by_platform):
+            if isinstance(results, Exception):
+                print(f"{platform} 키워드 검색 실패: {str(results)}")
                 continue
+            
+            # 플랫폼 정보 추가
+            for result in results:
+                result_dict = result.dict() if hasattr(result, 'dict') else result
+                result_dict['platform'] = platform
+                search_results.append(result_dict)
         
         return search_results
 
@@ -8,13 +8,47 @@ from typing import List, Optional, Dict, Any
 import asyncio
 import aiohttp
 import logging
-from datetime import datetime
+import re
+import orjson
+from datetime import datetime, timezone
 
 from models.response_models import TrendResponse, SearchResponse, HashtagResponse
 
+try:
+    # C 확장 ISO 8601 파서 (설치되지 않은 환경에서는 표준 라이브러리로 대체)
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = None
+
+# 해시태그 패턴 (모든 플랫폼 변환 루프에서 공유)
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# 고정 형식 UTC 시각 접미사 (예: Instagram "+0000", YouTube "Z")
+_UTC_SUFFIXES = ("+0000", "Z")
+
+
+def _parse_fixed_utc(value: str) -> Optional[datetime]:
+    """YYYY-MM-DDTHH:MM:SS(+0000|Z) 형식을 슬라이싱으로 직접 변환 (형식이 다르면 None)"""
+    if value[19:] not in _UTC_SUFFIXES or value[10] != 'T':
+        return None
+    try:
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                        tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+# 공유 HTTP 세션 설정
+_HTTP_POOL_LIMIT = 100           # 동시 커넥션 수
+_HTTP_KEEPALIVE_SECONDS = 60     # 유휴 커넥션 유지 시간
+_HTTP_TIMEOUT_SECONDS = 10       # 요청 전체 타임아웃
+
 class BaseSocialMediaService(ABC):
     """소셜 미디어 서비스 기본 클래스"""
     
+    # 인스턴스 속성 고정 (속성 접근을 슬롯 디스크립터로 처리하고 인스턴스 크기 축소)
+    __slots__ = ("platform_name", "logger", "session")
+    
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.logger = logging.getLogger(f"{platform_name}_service")
@@ -22,13 +56,33 @@ class BaseSocialMediaService(ABC):
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession()
+        self.get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
-        if self.session:
+        await self.close()
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 반환 (없거나 닫혔으면 새로 생성)
+        
+        요청마다 세션을 만들지 않고 keep-alive 커넥션 풀을 재사용한다.
+        """
+        if self.session is None or self.session.closed:
+            connector = self._create_connector()
+            timeout = aiohttp.ClientTimeout(total=_HTTP_TIMEOUT_SECONDS)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+    
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """공유 세션 커넥터 생성 (플랫폼별로 재정의 가능)"""
+        return aiohttp.TCPConnector(limit=_HTTP_POOL_LIMIT, keepalive_timeout=_HTTP_KEEPALIVE_SECONDS)
+    
+    async def close(self):
+        """공유 HTTP 세션 종료"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
     
     @abstractmethod
     async def get_trending_videos(self, max_results: int = 25, **kwargs) -> List[TrendResponse]:
@@ -48,13 +102,13 @@ class BaseSocialMediaService(ABC):
     async def make_request(self, url: str, headers: Optional[Dict[str, str]] = None, 
                           params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """HTTP 요청 수행 (공통 메서드)"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-            
+        session = self.get_session()
+        
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with session.get(url, headers=headers, params=params) as response:
                 if response.status == 200:
-                    return await response.json()
+                    # 바이트를 그대로 orjson으로 파싱 (문자열 디코딩 단계 생략)
+                    return orjson.loads(await response.read())
                 else:
                     self.logger.error(f"HTTP 요청 실패: {response.status} - {response.reason}")
                     raise Exception(f"HTTP {response.status}: {response.reason}")
@@ -89,13 +143,25 @@ class BaseSocialMediaService(ABC):
         else:
             return f"{minutes}:{seconds:02d}"
     
+    def parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        """ISO 8601 형식의 시각 문자열을 datetime으로 변환"""
+        if not value:
+            return None
+        if _parse_iso_datetime is not None:
+            return _parse_iso_datetime(value)
+        # ciso8601이 없으면 API가 주는 고정 형식은 범용 파서를 거치지 않고 처리
+        parsed = _parse_fixed_utc(value) if len(value) >= 20 else None
+        if parsed is not None:
+            return parsed
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    
     def extract_hashtags(self, text: str) -> List[str]:
         """텍스트에서 해시태그 추출"""
-        if not text:
+        # '#'이 없는 텍스트(대부분의 설명/제목)는 C 수준 문자열 검색만으로 건너뛴다
+        if not text or '#' not in text:
             return []
         
-        import re
-        hashtags = re.findall(r'#\w+', text)
+        hashtags = _HASHTAG_RE.findall(text)
         return [tag.lower() for tag in hashtags]
     
     def safe_int(self, value: Any) -> Optional[int]:
@@ -0,0 +1,101 @@
+"""
+프로세스 간 공유 캐시 저장소
+여러 워커 프로세스가 같은 SQLite 파일을 통해 API 응답(채널 정보 등)을 공유한다.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import orjson
+
+# 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 최대 시간(초), 초과하면 호출 측이 캐시를 건너뜀
+_BUSY_TIMEOUT_SECONDS = 1.0
+
+# 한 번의 IN 조회에 넣을 최대 키 수 (구버전 SQLite 바인딩 변수 제한 999 이내)
+_MAX_KEYS_PER_QUERY = 500
+
+
+class PersistentCache:
+    """SQLite 기반 키-값 TTL 캐시
+
+    값은 orjson으로 직렬화해 저장하며, 만료된 항목은 조회 시 무시하고 저장 시 정리한다.
+    메서드는 동기 호출이므로 비동기 코드에서는 asyncio.to_thread로 실행해 잠금 대기가
+    이벤트 루프를 막지 않도록 한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """연결은 처음 사용할 때 생성 (임포트/서비스 생성 시 파일을 만들지 않음)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """만료되지 않은 값 반환 (없으면 None)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """값 저장 (ttl초 후 만료)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value), now + ttl),
+                )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번의 쿼리로 조회 (만료되지 않은 항목만, 키 -> 값)"""
+        keys = list(keys)
+        rows = []
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # SQLite 바인딩 변수 수 제한을 넘지 않도록 나눠서 조회
+            for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[i:i + _MAX_KEYS_PER_QUERY]
+                rows.extend(conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now),
+                ).fetchall())
+        return {key: orjson.loads(value) for key, value in rows}
+
+    def set_many(self, items: Dict[str, Any], ttl: float):
+        """여러 값을 한 트랜잭션으로 저장 (ttl초 후 만료)"""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    [(key, orjson.dumps(value), now + ttl) for key, value in items.items()],
+                )
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
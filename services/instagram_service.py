@@ -6,22 +6,185 @@ Instagram의 트렌드 게시물, 해시태그, 검색 등을 조회하는 서
 
 import os
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+from cachetools import TTLCache
+
 from services.base_service import BaseSocialMediaService
 from models.response_models import TrendResponse, SearchResponse, HashtagResponse
 
+# 사용자 미디어 캐시 유지 시간(초)
+_USER_MEDIA_CACHE_TTL = 300
+
+# ==================== 샘플 데이터 ====================
+# 샘플 데이터는 요청마다 내용이 같으므로 임포트 시점에 응답 객체를 한 번만 생성한다.
+# 호출자가 결과를 수정해도 다른 요청에 영향이 없도록 반환할 때는 복사본을 만든다.
+# 직접 작성한 상수이므로 Pydantic 검증은 생략한다(model_construct).
+# 게시 시각은 실제 값이 없으므로 임포트 시점으로 고정한다.
+_SAMPLE_PUBLISHED_AT = datetime.now()
+
+_SAMPLE_POST_DATA = [
+    {
+        "id": "instagram_trend_001",
+        "title": "인기 Instagram 게시물 #1",
+        "description": "샘플 트렌딩 게시물입니다. 실제 구현에서는 Instagram API나 웹 스크래핑을 사용해야 합니다.",
+        "author": "instagram_user_1",
+        "view_count": 850000,
+        "like_count": 45000,
+        "comment_count": 1800,
+        "share_count": 1200,
+        "hashtags": ["#trending", "#viral", "#instagram"]
+    },
+    {
+        "id": "instagram_trend_002",
+        "title": "인기 Instagram 게시물 #2",
+        "description": "또 다른 샘플 트렌딩 게시물입니다.",
+        "author": "instagram_user_2",
+        "view_count": 720000,
+        "like_count": 38000,
+        "comment_count": 1500,
+        "share_count": 980,
+        "hashtags": ["#fashion", "#style", "#trending"]
+    },
+    {
+        "id": "instagram_trend_003",
+        "title": "인기 Instagram 게시물 #3",
+        "description": "세 번째 샘플 트렌딩 게시물입니다.",
+        "author": "instagram_user_3",
+        "view_count": 650000,
+        "like_count": 32000,
+        "comment_count": 1200,
+        "share_count": 850,
+        "hashtags": ["#food", "#delicious", "#viral"]
+    }
+]
+
+# {query} 자리표시자는 검색 시점에 str.format으로 채운다
+_SAMPLE_SEARCH_DATA = [
+    {
+        "id": "instagram_search_{query}_001",
+        "title": "'{query}' 관련 Instagram 게시물 #1",
+        "description": "'{query}' 키워드로 검색된 샘플 게시물입니다.",
+        "author": "instagram_search_user_1",
+        "view_count": 450000,
+        "like_count": 25000,
+        "comment_count": 800,
+        "hashtags": ["#{query}", "#search", "#instagram"]
+    },
+    {
+        "id": "instagram_search_{query}_002",
+        "title": "'{query}' 관련 Instagram 게시물 #2",
+        "description": "'{query}' 키워드로 검색된 또 다른 샘플 게시물입니다.",
+        "author": "instagram_search_user_2",
+        "view_count": 380000,
+        "like_count": 22000,
+        "comment_count": 650,
+        "hashtags": ["#{query}", "#trending", "#viral"]
+    }
+]
+
+_SAMPLE_HASHTAG_DATA = [
+    {"hashtag": "#instagram", "post_count": 2500000, "view_count": 80000000},
+    {"hashtag": "#trending", "post_count": 1800000, "view_count": 60000000},
+    {"hashtag": "#viral", "post_count": 1500000, "view_count": 50000000},
+    {"hashtag": "#fashion", "post_count": 1200000, "view_count": 40000000},
+    {"hashtag": "#food", "post_count": 980000, "view_count": 35000000},
+    {"hashtag": "#travel", "post_count": 850000, "view_count": 30000000},
+    {"hashtag": "#beauty", "post_count": 720000, "view_count": 25000000},
+    {"hashtag": "#lifestyle", "post_count": 650000, "view_count": 22000000}
+]
+
+_SAMPLE_TREND_POSTS: Tuple[TrendResponse, ...] = tuple(
+    TrendResponse.model_construct(
+        id=post["id"],
+        title=post["title"],
+        description=post["description"],
+        url=f"https://www.instagram.com/p/{post['id']}/",
+        thumbnail_url=None,  # 실제 구현에서는 썸네일 URL을 가져와야 함
+        platform="instagram",
+        author=post["author"],
+        author_url=f"https://www.instagram.com/{post['author']}/",
+        view_count=post["view_count"],
+        like_count=post["like_count"],
+        comment_count=post["comment_count"],
+        share_count=post["share_count"],
+        published_at=_SAMPLE_PUBLISHED_AT,  # 실제 구현에서는 실제 게시 시간을 가져와야 함
+        duration=None,  # Instagram은 동영상 길이를 API로 제공하지 않음
+        tags=None,
+        hashtags=post["hashtags"],
+        category=None,
+        language="ko",
+        region="KR"
+    )
+    for post in _SAMPLE_POST_DATA
+)
+
+_SAMPLE_SEARCH_TEMPLATES: Tuple[SearchResponse, ...] = tuple(
+    SearchResponse.model_construct(
+        id=result["id"],
+        title=result["title"],
+        description=result["description"],
+        url=f"https://www.instagram.com/p/{result['id']}/",
+        thumbnail_url=None,
+        platform="instagram",
+        author=result["author"],
+        author_url=f"https://www.instagram.com/{result['author']}/",
+        view_count=result["view_count"],
+        like_count=result["like_count"],
+        comment_count=result["comment_count"],
+        published_at=_SAMPLE_PUBLISHED_AT,
+        relevance_score=0.9 - (i * 0.1),  # 샘플 관련도 점수
+        tags=None,
+        hashtags=result["hashtags"]
+    )
+    for i, result in enumerate(_SAMPLE_SEARCH_DATA)
+)
+
+_SAMPLE_TRENDING_HASHTAGS: Tuple[HashtagResponse, ...] = tuple(
+    HashtagResponse.model_construct(
+        hashtag=hashtag_data["hashtag"],
+        post_count=hashtag_data["post_count"],
+        view_count=hashtag_data["view_count"],
+        platform="instagram",
+        trending_score=1.0 - (i * 0.1),  # 샘플 트렌딩 점수
+        related_hashtags=[related["hashtag"] for related in _SAMPLE_HASHTAG_DATA[i+1:i+4]]
+    )
+    for i, hashtag_data in enumerate(_SAMPLE_HASHTAG_DATA)
+)
+
+
+@lru_cache(maxsize=128)
+def _sample_search_results(query: str) -> Tuple[SearchResponse, ...]:
+    """검색어를 채운 샘플 검색 결과 (템플릿에 검색어만 채워서 복사)"""
+    values = {"query": query}
+    return tuple(
+        template.model_copy(update={
+            "id": template.id.format_map(values),
+            "title": template.title.format_map(values),
+            "description": template.description.format_map(values),
+            "url": template.url.format_map(values),
+            "hashtags": [tag.format_map(values) for tag in template.hashtags],
+        })
+        for template in _SAMPLE_SEARCH_TEMPLATES
+    )
+
+
 class InstagramService(BaseSocialMediaService):
     """Instagram Basic Display API 서비스"""
     
+    __slots__ = ("access_token", "app_id", "app_secret", "base_url", "_media_cache")
+    
     def __init__(self):
         super().__init__("instagram")
         self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
         self.app_id = os.getenv("INSTAGRAM_APP_ID")
         self.app_secret = os.getenv("INSTAGRAM_APP_SECRET")
         self.base_url = "https://graph.instagram.com/v12.0"
+        # 사용자 미디어 응답 캐시 (게시물은 자주 바뀌지 않으므로 TTL 동안 재사용)
+        self._media_cache: TTLCache = TTLCache(maxsize=256, ttl=_USER_MEDIA_CACHE_TTL)
         
         if not self.access_token:
             self.logger.warning("Instagram 액세스 토큰이 설정되지 않았습니다. 일부 기능이 제한될 수 있습니다.")
@@ -42,9 +205,8 @@ class InstagramService(BaseSocialMediaService):
             self.log_error("trending_posts", e)
             raise Exception(f"Instagram 트렌드 조회 실패: {str(e)}")
     
-    async def get_trending_posts(self, max_results: int = 20) -> List[TrendResponse]:
-        """Instagram 인기 게시물 조회 (제한적)"""
-        return await self.get_trending_videos(max_results)
+    # Instagram 용어 별칭 (래퍼 코루틴 없이 같은 메서드를 가리킴)
+    get_trending_posts = get_trending_videos
     
     async def search_videos(self, query: str, max_results: int = 20) -> List[SearchResponse]:
         """Instagram 게시물 검색 (제한적) - 기본 클래스 호환성을 위해 videos로 명명"""
@@ -65,9 +227,8 @@ class InstagramService(BaseSocialMediaService):
             self.log_error("search_posts", e)
             raise Exception(f"Instagram 검색 실패: {str(e)}")
     
-    async def search_posts(self, query: str, max_results: int = 20) -> List[SearchResponse]:
-        """Instagram 게시물 검색 (제한적)"""
-        return await self.search_videos(query, max_results)
+    # Instagram 용어 별칭 (래퍼 코루틴 없이 같은 메서드를 가리킴)
+    search_posts = search_videos
     
     async def get_trending_hashtags(self, max_results: int = 20) -> List[HashtagResponse]:
         """Instagram 인기 해시태그 조회 (제한적)"""
@@ -90,6 +251,11 @@ class InstagramService(BaseSocialMediaService):
         if not self.access_token:
             raise Exception("Instagram 액세스 토큰이 필요합니다.")
         
+        cache_key = (user_id, max_results)
+        cached = self._media_cache.get(cache_key)
+        if cached is not None:
+            return self._convert_media_items(cached)
+        
         try:
             self.log_request("user_media", {"user_id": user_id, "max_results": max_results})
             
@@ -100,18 +266,25 @@ class InstagramService(BaseSocialMediaService):
                 "limit": min(max_results, 25)  # API 제한
             }
             
-            response_data = await self.make_request(url, params=params)
-            media_items = response_data.get('data', [])
+            # 페이지당 최대 25개이므로 max_results를 채울 때까지 다음 페이지를 따라간다.
+            # 다음 페이지 커서는 직전 응답에서만 얻을 수 있어 순차적으로 조회한다.
+            media_items: List[Dict[str, Any]] = []
+            next_url: Optional[str] = url
+            while next_url and len(media_items) < max_results:
+                response_data = await self.make_request(next_url, params=params)
+                page_items = response_data.get('data', [])
+                if not page_items:
+                    # 필터링/만료된 항목 때문에 빈 페이지에 paging.next만 오는 경우가 있어 더 따라가지 않음
+                    break
+                media_items.extend(page_items)
+                next_url = response_data.get('paging', {}).get('next')
+                params = None  # paging.next URL에는 토큰/필드/limit가 이미 포함되어 있음
+            media_items = media_items[:max_results]
             
-            # 결과 변환
-            posts = []
-            for item in media_items:
-                try:
-                    post = self._convert_media_to_trend(item)
-                    posts.append(post)
-                except Exception as e:
-                    self.logger.warning(f"미디어 변환 실패: {str(e)}")
-                    continue
+            # 원본 응답 항목을 캐시하고 응답 모델은 호출마다 새로 만든다
+            # (한 호출자가 결과를 수정해도 캐시를 공유하는 다른 호출에 남지 않도록)
+            self._media_cache[cache_key] = tuple(media_items)
+            posts = self._convert_media_items(media_items)
             
             self.log_response("user_media", len(posts))
             return posts
@@ -121,147 +294,38 @@ class InstagramService(BaseSocialMediaService):
             raise
     
     def _get_sample_trending_posts(self, max_results: int) -> List[TrendResponse]:
-        """샘플 트렌딩 게시물 데이터 생성"""
-        sample_posts = [
-            {
-                "id": "instagram_trend_001",
-                "title": "인기 Instagram 게시물 #1",
-                "description": "샘플 트렌딩 게시물입니다. 실제 구현에서는 Instagram API나 웹 스크래핑을 사용해야 합니다.",
-                "author": "instagram_user_1",
-                "view_count": 850000,
-                "like_count": 45000,
-                "comment_count": 1800,
-                "share_count": 1200,
-                "hashtags": ["#trending", "#viral", "#instagram"]
-            },
-            {
-                "id": "instagram_trend_002",
-                "title": "인기 Instagram 게시물 #2",
-                "description": "또 다른 샘플 트렌딩 게시물입니다.",
-                "author": "instagram_user_2",
-                "view_count": 720000,
-                "like_count": 38000,
-                "comment_count": 1500,
-                "share_count": 980,
-                "hashtags": ["#fashion", "#style", "#trending"]
-            },
-            {
-                "id": "instagram_trend_003",
-                "title": "인기 Instagram 게시물 #3",
-                "description": "세 번째 샘플 트렌딩 게시물입니다.",
-                "author": "instagram_user_3",
-                "view_count": 650000,
-                "like_count": 32000,
-                "comment_count": 1200,
-                "share_count": 850,
-                "hashtags": ["#food", "#delicious", "#viral"]
-            }
-        ]
-        
-        posts = []
-        for i, post in enumerate(sample_posts[:max_results]):
-            posts.append(TrendResponse(
-                id=post["id"],
-                title=post["title"],
-                description=post["description"],
-                url=f"https://www.instagram.com/p/{post['id']}/",
-                thumbnail_url=None,  # 실제 구현에서는 썸네일 URL을 가져와야 함
-                platform="instagram",
-                author=post["author"],
-                author_url=f"https://www.instagram.com/{post['author']}/",
-                view_count=post["view_count"],
-                like_count=post["like_count"],
-                comment_count=post["comment_count"],
-                share_count=post["share_count"],
-                published_at=datetime.now(),  # 실제 구현에서는 실제 게시 시간을 가져와야 함
-                duration=None,  # Instagram은 동영상 길이를 API로 제공하지 않음
-                tags=None,
-                hashtags=post["hashtags"],
-                category=None,
-                language="ko",
-                region="KR"
-            ))
-        
-        return posts
+        """샘플 트렌딩 게시물 데이터 반환 (임포트 시점에 생성된 응답의 복사본)"""
+        return [post.model_copy(deep=True) for post in _SAMPLE_TREND_POSTS[:max_results]]
     
     def _get_sample_search_results(self, query: str, max_results: int) -> List[SearchResponse]:
-        """샘플 검색 결과 데이터 생성"""
-        sample_results = [
-            {
-                "id": f"instagram_search_{query}_001",
-                "title": f"'{query}' 관련 Instagram 게시물 #1",
-                "description": f"'{query}' 키워드로 검색된 샘플 게시물입니다.",
-                "author": "instagram_search_user_1",
-                "view_count": 450000,
-                "like_count": 25000,
-                "comment_count": 800,
-                "hashtags": [f"#{query}", "#search", "#instagram"]
-            },
-            {
-                "id": f"instagram_search_{query}_002",
-                "title": f"'{query}' 관련 Instagram 게시물 #2",
-                "description": f"'{query}' 키워드로 검색된 또 다른 샘플 게시물입니다.",
-                "author": "instagram_search_user_2",
-                "view_count": 380000,
-                "like_count": 22000,
-                "comment_count": 650,
-                "hashtags": [f"#{query}", "#trending", "#viral"]
-            }
-        ]
-        
-        results = []
-        for i, result in enumerate(sample_results[:max_results]):
-            results.append(SearchResponse(
-                id=result["id"],
-                title=result["title"],
-                description=result["description"],
-                url=f"https://www.instagram.com/p/{result['id']}/",
-                thumbnail_url=None,
-                platform="instagram",
-                author=result["author"],
-                author_url=f"https://www.instagram.com/{result['author']}/",
-                view_count=result["view_count"],
-                like_count=result["like_count"],
-                comment_count=result["comment_count"],
-                published_at=datetime.now(),
-                relevance_score=0.9 - (i * 0.1),  # 샘플 관련도 점수
-                tags=None,
-                hashtags=result["hashtags"]
-            ))
-        
-        return results
+        """샘플 검색 결과 데이터 반환 (검색어별로 캐시된 응답의 복사본)"""
+        return [result.model_copy(deep=True) for result in _sample_search_results(query)[:max_results]]
     
     def _get_sample_trending_hashtags(self, max_results: int) -> List[HashtagResponse]:
-        """샘플 트렌딩 해시태그 데이터 생성"""
-        sample_hashtags = [
-            {"hashtag": "#instagram", "post_count": 2500000, "view_count": 80000000},
-            {"hashtag": "#trending", "post_count": 1800000, "view_count": 60000000},
-            {"hashtag": "#viral", "post_count": 1500000, "view_count": 50000000},
-            {"hashtag": "#fashion", "post_count": 1200000, "view_count": 40000000},
-            {"hashtag": "#food", "post_count": 980000, "view_count": 35000000},
-            {"hashtag": "#travel", "post_count": 850000, "view_count": 30000000},
-            {"hashtag": "#beauty", "post_count": 720000, "view_count": 25000000},
-            {"hashtag": "#lifestyle", "post_count": 650000, "view_count": 22000000}
-        ]
-        
-        hashtags = []
-        for i, hashtag_data in enumerate(sample_hashtags[:max_results]):
-            hashtags.append(HashtagResponse(
-                hashtag=hashtag_data["hashtag"],
-                post_count=hashtag_data["post_count"],
-                view_count=hashtag_data["view_count"],
-                platform="instagram",
-                trending_score=1.0 - (i * 0.1),  # 샘플 트렌딩 점수
-                related_hashtags=[f"#{sample_hashtags[j]['hashtag'][1:]}" for j in range(i+1, min(i+4, len(sample_hashtags)))]
-            ))
-        
-        return hashtags
+        """샘플 트렌딩 해시태그 데이터 반환 (임포트 시점에 생성된 응답의 복사본)"""
+        return [hashtag.model_copy(deep=True) for hashtag in _SAMPLE_TRENDING_HASHTAGS[:max_results]]
+    
+    def _convert_media_items(self, media_items: Iterable[Dict[str, Any]]) -> List[TrendResponse]:
+        """미디어 항목 목록 변환 (변환에 실패한 항목은 제외)"""
+        return [post for post in map(self._safe_convert_media, media_items) if post is not None]
+    
+    def _safe_convert_media(self, media_item: Dict[str, Any]) -> Optional[TrendResponse]:
+        """미디어 변환 (실패 시 경고 로그 후 None 반환)"""
+        try:
+            return self._convert_media_to_trend(media_item)
+        except Exception as e:
+            self.logger.warning(f"미디어 변환 실패: {str(e)}")
+            return None
     
     def _convert_media_to_trend(self, media_item: Dict[str, Any]) -> TrendResponse:
         """Instagram API 응답을 TrendResponse로 변환"""
         caption = media_item.get('caption', '')
         hashtags = self.extract_hashtags(caption)
         
+        # Graph API는 카운트를 정수로 내려주므로 정수일 때는 safe_int 호출을 생략
+        like_count = media_item.get('like_count')
+        comments_count = media_item.get('comments_count')
+        
         return TrendResponse(
             id=media_item.get('id', ''),
             title=caption[:100] if caption else "Instagram 게시물",
@@ -272,10 +336,10 @@ class InstagramService(BaseSocialMediaService):
             author="me",  # Instagram Basic Display API는 자신의 게시물만 조회 가능
             author_url="https://www.instagram.com/me/",
             view_count=None,  # Instagram API는 조회수를 제공하지 않음
-            like_count=self.safe_int(media_item.get('like_count')),
-            comment_count=self.safe_int(media_item.get('comments_count')),
+            like_count=like_count if isinstance(like_count, int) else self.safe_int(like_count),
+            comment_count=comments_count if isinstance(comments_count, int) else self.safe_int(comments_count),
             share_count=None,  # Instagram API는 공유 수를 제공하지 않음
-            published_at=datetime.fromisoformat(media_item.get('timestamp', '').replace('Z', '+00:00')) if media_item.get('timestamp') else None,
+            published_at=self.parse_datetime(media_item.get('timestamp')),
             duration=None,  # Instagram은 동영상 길이를 API로 제공하지 않음
             tags=None,
             hashtags=hashtags,
@@ -7,30 +7,196 @@ TikTok의 트렌드 동영상, 해시태그, 검색 등을 조회하는 서비
 import os
 import json
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 from services.base_service import BaseSocialMediaService
 from models.response_models import TrendResponse, SearchResponse, HashtagResponse
 
+# ==================== 샘플 데이터 ====================
+# 샘플 데이터는 요청마다 내용이 같으므로 임포트 시점에 응답 객체를 한 번만 생성한다.
+# 호출자가 결과를 수정해도 다른 요청에 영향이 없도록 반환할 때는 복사본을 만든다.
+# 직접 작성한 상수이므로 Pydantic 검증은 생략한다(model_construct).
+# 게시 시각은 실제 값이 없으므로 임포트 시점으로 고정한다.
+_SAMPLE_PUBLISHED_AT = datetime.now()
+
+_SAMPLE_VIDEO_DATA = [
+    {
+        "id": "tiktok_trend_001",
+        "title": "인기 TikTok 동영상 #1",
+        "description": "샘플 트렌딩 동영상입니다. 실제 구현에서는 TikTok API나 웹 스크래핑을 사용해야 합니다.",
+        "author": "tiktok_user_1",
+        "url": "https://www.tiktok.com/@tiktok_user_1/video/tiktok_trend_001",
+        "author_url": "https://www.tiktok.com/@tiktok_user_1",
+        "view_count": 1500000,
+        "like_count": 85000,
+        "comment_count": 3200,
+        "share_count": 1500,
+        "hashtags": ["#trending", "#viral", "#funny"]
+    },
+    {
+        "id": "tiktok_trend_002", 
+        "title": "인기 TikTok 동영상 #2",
+        "description": "또 다른 샘플 트렌딩 동영상입니다.",
+        "author": "tiktok_user_2",
+        "url": "https://www.tiktok.com/@tiktok_user_2/video/tiktok_trend_002",
+        "author_url": "https://www.tiktok.com/@tiktok_user_2",
+        "view_count": 1200000,
+        "like_count": 72000,
+        "comment_count": 2800,
+        "share_count": 1200,
+        "hashtags": ["#dance", "#music", "#trending"]
+    },
+    {
+        "id": "tiktok_trend_003",
+        "title": "인기 TikTok 동영상 #3", 
+        "description": "세 번째 샘플 트렌딩 동영상입니다.",
+        "author": "tiktok_user_3",
+        "url": "https://www.tiktok.com/@tiktok_user_3/video/tiktok_trend_003",
+        "author_url": "https://www.tiktok.com/@tiktok_user_3",
+        "view_count": 980000,
+        "like_count": 65000,
+        "comment_count": 2400,
+        "share_count": 980,
+        "hashtags": ["#comedy", "#funny", "#viral"]
+    }
+]
+
+# {query} 자리표시자는 검색 시점에 str.format으로 채운다
+_SAMPLE_SEARCH_DATA = [
+    {
+        "id": "tiktok_search_{query}_001",
+        "title": "'{query}' 관련 TikTok 동영상 #1",
+        "description": "'{query}' 키워드로 검색된 샘플 동영상입니다.",
+        "author": "tiktok_search_user_1",
+        "view_count": 850000,
+        "like_count": 45000,
+        "comment_count": 1800,
+        "hashtags": ["#{query}", "#search", "#viral"]
+    },
+    {
+        "id": "tiktok_search_{query}_002",
+        "title": "'{query}' 관련 TikTok 동영상 #2",
+        "description": "'{query}' 키워드로 검색된 또 다른 샘플 동영상입니다.",
+        "author": "tiktok_search_user_2", 
+        "view_count": 720000,
+        "like_count": 38000,
+        "comment_count": 1500,
+        "hashtags": ["#{query}", "#trending", "#funny"]
+    }
+]
+
+_SAMPLE_HASHTAG_DATA = [
+    {"hashtag": "#trending", "post_count": 1500000, "view_count": 50000000},
+    {"hashtag": "#viral", "post_count": 1200000, "view_count": 45000000},
+    {"hashtag": "#funny", "post_count": 980000, "view_count": 38000000},
+    {"hashtag": "#dance", "post_count": 850000, "view_count": 32000000},
+    {"hashtag": "#music", "post_count": 720000, "view_count": 28000000},
+    {"hashtag": "#comedy", "post_count": 650000, "view_count": 25000000},
+    {"hashtag": "#fyp", "post_count": 580000, "view_count": 22000000},
+    {"hashtag": "#foryou", "post_count": 520000, "view_count": 20000000}
+]
+
+_SAMPLE_TREND_VIDEOS: Tuple[TrendResponse, ...] = tuple(
+    TrendResponse.model_construct(
+        id=video["id"],
+        title=video["title"],
+        description=video["description"],
+        url=video["url"],
+        thumbnail_url=None,  # 실제 구현에서는 썸네일 URL을 가져와야 함
+        platform="tiktok",
+        author=video["author"],
+        author_url=video["author_url"],
+        view_count=video["view_count"],
+        like_count=video["like_count"],
+        comment_count=video["comment_count"],
+        share_count=video["share_count"],
+        published_at=_SAMPLE_PUBLISHED_AT,  # 실제 구현에서는 실제 게시 시간을 가져와야 함
+        duration=None,  # TikTok은 동영상 길이를 API로 제공하지 않음
+        tags=None,
+        hashtags=video["hashtags"],
+        category=None,
+        language="ko",
+        region="KR"
+    )
+    for video in _SAMPLE_VIDEO_DATA
+)
+
+_SAMPLE_SEARCH_TEMPLATES: Tuple[SearchResponse, ...] = tuple(
+    SearchResponse.model_construct(
+        id=result["id"],
+        title=result["title"],
+        description=result["description"],
+        url=f"https://www.tiktok.com/@{result['author']}/video/{result['id']}",
+        thumbnail_url=None,
+        platform="tiktok",
+        author=result["author"],
+        author_url=f"https://www.tiktok.com/@{result['author']}",
+        view_count=result["view_count"],
+        like_count=result["like_count"],
+        comment_count=result["comment_count"],
+        published_at=_SAMPLE_PUBLISHED_AT,
+        relevance_score=0.9 - (i * 0.1),  # 샘플 관련도 점수
+        tags=None,
+        hashtags=result["hashtags"]
+    )
+    for i, result in enumerate(_SAMPLE_SEARCH_DATA)
+)
+
+_SAMPLE_TRENDING_HASHTAGS: Tuple[HashtagResponse, ...] = tuple(
+    HashtagResponse.model_construct(
+        hashtag=hashtag_data["hashtag"],
+        post_count=hashtag_data["post_count"],
+        view_count=hashtag_data["view_count"],
+        platform="tiktok",
+        trending_score=1.0 - (i * 0.1),  # 샘플 트렌딩 점수
+        related_hashtags=[related["hashtag"] for related in _SAMPLE_HASHTAG_DATA[i+1:i+4]]
+    )
+    for i, hashtag_data in enumerate(_SAMPLE_HASHTAG_DATA)
+)
+
+
+@lru_cache(maxsize=128)
+def _sample_search_results(query: str) -> Tuple[SearchResponse, ...]:
+    """검색어를 채운 샘플 검색 결과 (템플릿에 검색어만 채워서 복사)"""
+    values = {"query": query}
+    return tuple(
+        template.model_copy(update={
+            "id": template.id.format_map(values),
+            "title": template.title.format_map(values),
+            "description": template.description.format_map(values),
+            "url": template.url.format_map(values),
+            "hashtags": [tag.format_map(values) for tag in template.hashtags],
+        })
+        for template in _SAMPLE_SEARCH_TEMPLATES
+    )
+
+
 class TikTokService(BaseSocialMediaService):
     """TikTok 비공식 API 서비스"""
     
+    __slots__ = ("session_id", "base_url", "headers")
+    
+    # 기본 헤더 (읽기 전용, 인스턴스마다 복사해서 사용)
+    _BASE_HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    })
+    
     def __init__(self):
         super().__init__("tiktok")
         self.session_id = os.getenv("TIKTOK_SESSION_ID")
         self.base_url = "https://www.tiktok.com"
         
         # 기본 헤더 설정
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        self.headers = dict(self._BASE_HEADERS)
         
         if self.session_id:
             self.headers["Cookie"] = f"sessionid={self.session_id}"
@@ -86,141 +252,16 @@ class TikTokService(BaseSocialMediaService):
             raise Exception(f"TikTok 해시태그 조회 실패: {str(e)}")
     
     def _get_sample_trending_videos(self, max_results: int) -> List[TrendResponse]:
-        """샘플 트렌딩 동영상 데이터 생성"""
-        sample_videos = [
-            {
-                "id": "tiktok_trend_001",
-                "title": "인기 TikTok 동영상 #1",
-                "description": "샘플 트렌딩 동영상입니다. 실제 구현에서는 TikTok API나 웹 스크래핑을 사용해야 합니다.",
-                "author": "tiktok_user_1",
-                "view_count": 1500000,
-                "like_count": 85000,
-                "comment_count": 3200,
-                "share_count": 1500,
-                "hashtags": ["#trending", "#viral", "#funny"]
-            },
-            {
-                "id": "tiktok_trend_002", 
-                "title": "인기 TikTok 동영상 #2",
-                "description": "또 다른 샘플 트렌딩 동영상입니다.",
-                "author": "tiktok_user_2",
-                "view_count": 1200000,
-                "like_count": 72000,
-                "comment_count": 2800,
-                "share_count": 1200,
-                "hashtags": ["#dance", "#music", "#trending"]
-            },
-            {
-                "id": "tiktok_trend_003",
-                "title": "인기 TikTok 동영상 #3", 
-                "description": "세 번째 샘플 트렌딩 동영상입니다.",
-                "author": "tiktok_user_3",
-                "view_count": 980000,
-                "like_count": 65000,
-                "comment_count": 2400,
-                "share_count": 980,
-                "hashtags": ["#comedy", "#funny", "#viral"]
-            }
-        ]
-        
-        trends = []
-        for i, video in enumerate(sample_videos[:max_results]):
-            trends.append(TrendResponse(
-                id=video["id"],
-                title=video["title"],
-                description=video["description"],
-                url=f"https://www.tiktok.com/@tiktok_user_{i+1}/video/{video['id']}",
-                thumbnail_url=None,  # 실제 구현에서는 썸네일 URL을 가져와야 함
-                platform="tiktok",
-                author=video["author"],
-                author_url=f"https://www.tiktok.com/@{video['author']}",
-                view_count=video["view_count"],
-                like_count=video["like_count"],
-                comment_count=video["comment_count"],
-                share_count=video["share_count"],
-                published_at=datetime.now(),  # 실제 구현에서는 실제 게시 시간을 가져와야 함
-                duration=None,  # TikTok은 동영상 길이를 API로 제공하지 않음
-                tags=None,
-                hashtags=video["hashtags"],
-                category=None,
-                language="ko",
-                region="KR"
-            ))
-        
-        return trends
+        """샘플 트렌딩 동영상 데이터 반환 (임포트 시점에 생성된 응답의 복사본)"""
+        return [video.model_copy(deep=True) for video in _SAMPLE_TREND_VIDEOS[:max_results]]
     
     def _get_sample_search_results(self, query: str, max_results: int) -> List[SearchResponse]:
-        """샘플 검색 결과 데이터 생성"""
-        sample_results = [
-            {
-                "id": f"tiktok_search_{query}_001",
-                "title": f"'{query}' 관련 TikTok 동영상 #1",
-                "description": f"'{query}' 키워드로 검색된 샘플 동영상입니다.",
-                "author": "tiktok_search_user_1",
-                "view_count": 850000,
-                "like_count": 45000,
-                "comment_count": 1800,
-                "hashtags": [f"#{query}", "#search", "#viral"]
-            },
-            {
-                "id": f"tiktok_search_{query}_002",
-                "title": f"'{query}' 관련 TikTok 동영상 #2",
-                "description": f"'{query}' 키워드로 검색된 또 다른 샘플 동영상입니다.",
-                "author": "tiktok_search_user_2", 
-                "view_count": 720000,
-                "like_count": 38000,
-                "comment_count": 1500,
-                "hashtags": [f"#{query}", "#trending", "#funny"]
-            }
-        ]
-        
-        results = []
-        for i, result in enumerate(sample_results[:max_results]):
-            results.append(SearchResponse(
-                id=result["id"],
-                title=result["title"],
-                description=result["description"],
-                url=f"https://www.tiktok.com/@{result['author']}/video/{result['id']}",
-                thumbnail_url=None,
-                platform="tiktok",
-                author=result["author"],
-                author_url=f"https://www.tiktok.com/@{result['author']}",
-                view_count=result["view_count"],
-                like_count=result["like_count"],
-                comment_count=result["comment_count"],
-                published_at=datetime.now(),
-                relevance_score=0.9 - (i * 0.1),  # 샘플 관련도 점수
-                tags=None,
-                hashtags=result["hashtags"]
-            ))
-        
-        return results
+        """샘플 검색 결과 데이터 반환 (검색어별로 캐시된 응답의 복사본)"""
+        return [result.model_copy(deep=True) for result in _sample_search_results(query)[:max_results]]
     
     def _get_sample_trending_hashtags(self, max_results: int) -> List[HashtagResponse]:
-        """샘플 트렌딩 해시태그 데이터 생성"""
-        sample_hashtags = [
-            {"hashtag": "#trending", "post_count": 1500000, "view_count": 50000000},
-            {"hashtag": "#viral", "post_count": 1200000, "view_count": 45000000},
-            {"hashtag": "#funny", "post_count": 980000, "view_count": 38000000},
-            {"hashtag": "#dance", "post_count": 850000, "view_count": 32000000},
-            {"hashtag": "#music", "post_count": 720000, "view_count": 28000000},
-            {"hashtag": "#comedy", "post_count": 650000, "view_count": 25000000},
-            {"hashtag": "#fyp", "post_count": 580000, "view_count": 22000000},
-            {"hashtag": "#foryou", "post_count": 520000, "view_count": 20000000}
-        ]
-        
-        hashtags = []
-        for i, hashtag_data in enumerate(sample_hashtags[:max_results]):
-            hashtags.append(HashtagResponse(
-                hashtag=hashtag_data["hashtag"],
-                post_count=hashtag_data["post_count"],
-                view_count=hashtag_data["view_count"],
-                platform="tiktok",
-                trending_score=1.0 - (i * 0.1),  # 샘플 트렌딩 점수
-                related_hashtags=[f"#{sample_hashtags[j]['hashtag'][1:]}" for j in range(i+1, min(i+4, len(sample_hashtags)))]
-            ))
-        
-        return hashtags
+        """샘플 트렌딩 해시태그 데이터 반환 (임포트 시점에 생성된 응답의 복사본)"""
+        return [hashtag.model_copy(deep=True) for hashtag in _SAMPLE_TRENDING_HASHTAGS[:max_results]]
     
     async def _scrape_tiktok_trends(self) -> List[Dict[str, Any]]:
         """TikTok 트렌드 웹 스크래핑 (실제 구현 시 사용)"""
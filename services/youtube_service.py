@@ -4,14 +4,31 @@ YouTube의 트렌드 동영상, 검색, 채널 정보 등을 조회하는 서비
 """
 
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+import asyncio
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from email.parser import FeedParser
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    List, Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, Iterator, Mapping, Tuple, TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
 import logging
 
+import aiohttp
+import httplib2
+import orjson
+from cachetools import LRUCache, TTLCache
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from services.base_service import BaseSocialMediaService
+from services.cache_store import PersistentCache
 from models.response_models import (
     TrendResponse,
     SearchResponse,
@@ -22,9 +39,106 @@ from models.response_models import (
     YouTubeAnalyzeResponse,
 )
 
+# 응답 필드 마스크 (변환에 쓰는 값만 받아 전송/파싱 바이트를 줄인다)
+_VIDEO_FIELDS = (
+    "items(id,etag,"
+    "snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/high/url,"
+    "categoryId,defaultLanguage,defaultAudioLanguage),"
+    "statistics(viewCount,likeCount,commentCount),"
+    "contentDetails/duration)"
+)
+# 검색 결과 변환은 길이/카테고리/언어를 쓰지 않으므로 contentDetails 없이 조회
+_SEARCH_VIDEO_FIELDS = (
+    "items(id,etag,"
+    "snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/high/url),"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+_SEARCH_ID_FIELDS = "items/id/videoId"
+
+# ISO 8601 영상 길이 (P#DT#H#M#S, 긴 스트리밍/다시보기는 일 단위가 붙음)
+_ISO_DUR_RE = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+# 누락된 응답 하위 객체 대신 쓰는 빈 매핑 (조회마다 빈 dict를 만들지 않음)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# 영상/채널 링크 접두어 (변환 루프에서 문자열 연결로 사용)
+_WATCH_URL = "https://www.youtube.com/watch?v="
+_CHANNEL_URL = "https://www.youtube.com/channel/"
+
+# channels.list 한 번에 조회할 수 있는 최대 ID 수
+_CHANNEL_BATCH_SIZE = 50
+
+# HTTP 배치(multipart/mixed) 한 번에 담을 최대 하위 요청 수
+_BATCH_MAX_PARTS = 50
+# 배치 하위 응답의 헤더와 본문 사이 빈 줄 (CRLF/LF 모두 허용)
+_BATCH_HEADER_END_RE = re.compile(r'\r?\n\r?\n')
+
+# 동시에 진행할 수 있는 YouTube API 요청 수 기본값 (YOUTUBE_MAX_CONCURRENCY로 변경)
+_DEFAULT_MAX_CONCURRENCY = 8
+
+# YouTube API 요청 1회 타임아웃 기본값(초) (YT_TIMEOUT으로 변경)
+_DEFAULT_CALL_TIMEOUT = 5.0
+
+# YouTube API 요청 시작 간 최소 간격 기본값(초) (YOUTUBE_MIN_INTERVAL로 변경, 0이면 간격 제한 없음)
+_DEFAULT_MIN_INTERVAL = 0.15
+
+# 프로세스 간 공유 캐시(YOUTUBE_CACHE_DB 설정 시)의 채널 정보 유지 시간(초)
+_CHANNEL_STORE_TTL = 3600
+
+# googleapis.com 커넥션 풀 설정 (같은 호스트로 요청이 몰리므로 호스트당 상한과 DNS 캐시 사용)
+_API_CONNECTIONS_PER_HOST = 20
+_API_KEEPALIVE_SECONDS = 120
+_API_DNS_CACHE_SECONDS = 600
+
+# 429(요청 과다) 적응형 재시도 설정
+_RETRY_MAX_ATTEMPTS = 3          # 최초 요청 이후 최대 재시도 횟수
+_RETRY_BASE_SECONDS = 1.0        # 기본 대기 시간
+_RETRY_CONGESTION_FACTOR = 10.0  # 최근 429 비율이 대기 시간에 주는 가중치(K)
+_RETRY_EWMA_ALPHA = 0.2          # 429 비율 지수이동평균 가중치
+
+_T = TypeVar("_T")
+
+
+class _ThrottleTelemetry:
+    """최근 API 응답 중 429 비율(EWMA)을 서비스 인스턴스 전체에서 집계"""
+    
+    __slots__ = ("rate", "lock")
+    
+    def __init__(self):
+        self.rate = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def record(self, throttled: bool):
+        async with self.lock:
+            self.rate += _RETRY_EWMA_ALPHA * ((1.0 if throttled else 0.0) - self.rate)
+    
+    def backoff(self, retry_after: float) -> float:
+        """혼잡도(429 비율)에 비례한 지터 대기 시간, Retry-After 값을 하한으로 사용"""
+        delay = _RETRY_BASE_SECONDS * (1 + self.rate * _RETRY_CONGESTION_FACTOR) * random.random()
+        return max(delay, retry_after)
+
+# 채널 핸들 -> channelId 매핑 유지 시간(초)
+_HANDLE_CACHE_TTL = 7 * 24 * 3600
+
+# 영상 공통 변환 결과 보관 개수
+_COMMON_CACHE_SIZE = 2048
+
+# 인기 동영상 캐시 유지 시간(초) (순위가 자주 바뀌므로 짧게)
+_TRENDING_CACHE_TTL = 300
+# 채널 정보 캐시 유지 시간(초) (이름/구독자 수 등은 시간 단위 지연을 허용)
+_CHANNEL_CACHE_TTL = 3600
+# 분석 보강용 채널 구독자 수 유지 시간(초) (구독자 수는 천천히 바뀌므로 하루 단위 지연 허용)
+_SUBSCRIBER_CACHE_TTL = 24 * 3600
+
+# 분석 행과 필터용 값 (행, 업로드 시각 epoch 초, 초 단위 영상 길이)
+_AnalyzeEntry = Tuple[YouTubeAnalyzeRow, Optional[float], int]
+
 class YouTubeService(BaseSocialMediaService):
     """YouTube Data API v3 서비스"""
     
+    # 429 비율 집계 (모든 인스턴스 공유)
+    _throttle = _ThrottleTelemetry()
+    
     def __init__(self):
         super().__init__("youtube")
         self.api_key = os.getenv("YOUTUBE_API_KEY")
@@ -37,6 +151,238 @@ class YouTubeService(BaseSocialMediaService):
         except Exception as e:
             self.logger.error(f"YouTube API 클라이언트 초기화 실패: {str(e)}")
             self.youtube = None
+        
+        # 인기 동영상/채널 정보 응답 캐시 (쿼터 소모가 큰 동일 요청 반복 방지)
+        self._trending_cache: TTLCache = TTLCache(maxsize=512, ttl=_TRENDING_CACHE_TTL)
+        self._channel_cache: TTLCache = TTLCache(maxsize=512, ttl=_CHANNEL_CACHE_TTL)
+        self._handle_cache: TTLCache = TTLCache(maxsize=1024, ttl=_HANDLE_CACHE_TTL)
+        self._subscriber_cache: TTLCache = TTLCache(maxsize=4096, ttl=_SUBSCRIBER_CACHE_TTL)
+        self._cache_locks: Dict[Hashable, asyncio.Lock] = {}
+        # 키별 잠금을 잡고 있거나 기다리는 호출 수 (0이 되면 잠금 제거)
+        self._cache_waiters: Dict[Hashable, int] = {}
+        # 영상별 공통 변환 결과 ((id, etag) 기준)
+        self._common_cache: LRUCache = LRUCache(maxsize=_COMMON_CACHE_SIZE)
+        # 외부 API 요청 동시성 제한 (gather 팬아웃이 429 폭주로 이어지지 않도록)
+        max_concurrency = int(os.getenv("YOUTUBE_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY))
+        self._request_semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        # 요청 1회당 최대 대기 시간(초), 초과 시 취소 후 재시도
+        self._call_timeout = float(os.getenv("YT_TIMEOUT", _DEFAULT_CALL_TIMEOUT))
+        # 요청 시작 간 최소 간격(초)과 다음 요청을 보낼 수 있는 시각(이벤트 루프 시계 기준)
+        self._min_interval = max(float(os.getenv("YOUTUBE_MIN_INTERVAL", _DEFAULT_MIN_INTERVAL)), 0.0)
+        self._next_request_at = 0.0
+        # 워커 프로세스 간 공유 캐시 (SQLite 파일 경로가 설정된 경우에만 사용)
+        cache_db = os.getenv("YOUTUBE_CACHE_DB")
+        self._store: Optional[PersistentCache] = PersistentCache(cache_db) if cache_db else None
+    
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """googleapis.com 전용 커넥터 (연결을 오래 유지해 TLS 핸드셰이크 재수행 방지)"""
+        return aiohttp.TCPConnector(
+            limit_per_host=_API_CONNECTIONS_PER_HOST,
+            keepalive_timeout=_API_KEEPALIVE_SECONDS,
+            ttl_dns_cache=_API_DNS_CACHE_SECONDS,
+        )
+    
+    async def close(self):
+        """공유 HTTP 세션 및 공유 캐시 연결 종료"""
+        await super().close()
+        if self._store is not None:
+            self._store.close()
+    
+    async def _cached(self, cache: TTLCache, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """TTL 캐시 조회, 미스 시 키별 잠금으로 동시 요청을 한 번의 API 호출로 합친다"""
+        value = cache.get(key)
+        if value is not None:
+            return value
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        self._cache_waiters[key] = self._cache_waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                value = cache.get(key)
+                if value is None:
+                    value = await loader()
+                    cache[key] = value
+            return value
+        finally:
+            # 로더가 실패해 깨어난 대기 호출이 남아 있으면 잠금을 유지해야
+            # 새로 들어온 호출이 다른 잠금으로 같은 API를 동시에 호출하지 않는다
+            remaining = self._cache_waiters.pop(key) - 1
+            if remaining:
+                self._cache_waiters[key] = remaining
+            else:
+                del self._cache_locks[key]
+    
+    async def _with_retry(self, send: Callable[[], Awaitable[_T]]) -> _T:
+        """HTTP 429 응답이나 타임아웃 시 최근 혼잡도에 맞춰 대기 후 재시도 (횟수 초과 시 원래 예외 전달)
+        
+        각 시도는 요청 간격(_pace)을 맞춘 뒤 동시성 제한 슬롯 안에서 호출별 타임아웃(YT_TIMEOUT)을 적용해 실행한다.
+        간격 대기는 슬롯 밖에서 하므로 동시성 제한은 실제로 진행 중인 HTTP 요청 수에만 적용된다.
+        """
+        for attempt in range(_RETRY_MAX_ATTEMPTS + 1):
+            try:
+                await self._pace()
+                async with self._request_semaphore:
+                    result = await asyncio.wait_for(send(), self._call_timeout)
+            except asyncio.TimeoutError:
+                # 응답 지연도 혼잡 신호로 보고 429와 같은 방식으로 재시도
+                await self._throttle.record(True)
+                if attempt == _RETRY_MAX_ATTEMPTS:
+                    raise
+                delay = self._throttle.backoff(0.0)
+                self.logger.warning(f"YouTube API 응답 시간 초과, {delay:.2f}초 후 재시도 ({attempt + 1}/{_RETRY_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+            except HttpError as e:
+                throttled = e.resp.status == 429
+                await self._throttle.record(throttled)
+                if not throttled or attempt == _RETRY_MAX_ATTEMPTS:
+                    raise
+                retry_after = self.safe_float(e.resp.get("retry-after")) or 0.0
+                delay = self._throttle.backoff(retry_after)
+                self.logger.warning(f"YouTube API 요청 제한(429), {delay:.2f}초 후 재시도 ({attempt + 1}/{_RETRY_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+            else:
+                await self._throttle.record(False)
+                return result
+    
+    async def _pace(self):
+        """요청 시작 시각을 최소 간격(YOUTUBE_MIN_INTERVAL)만큼 벌려 분당 쿼터 초과(429)를 예방
+        
+        호출마다 다음 시작 시각을 먼저 예약하므로 동시에 대기하는 요청도 간격을 두고 차례로 나간다.
+        """
+        if self._min_interval <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_request_at)
+        self._next_request_at = start + self._min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    @staticmethod
+    def _http_error(response, body: bytes, uri: str) -> HttpError:
+        """aiohttp 실패 응답을 googleapiclient HttpError로 변환"""
+        headers = {"status": response.status, "reason": response.reason}
+        if "Retry-After" in response.headers:
+            headers["retry-after"] = response.headers["Retry-After"]
+        return HttpError(httplib2.Response(headers), body, uri=uri)
+    
+    async def _execute(self, request) -> Dict[str, Any]:
+        """googleapiclient 요청을 공유 aiohttp 세션으로 비동기 실행
+        
+        요청 객체는 URL(쿼리/키 포함) 생성에만 사용하고, 동기 .execute()로
+        이벤트 루프를 막지 않는다. 실패 응답은 기존과 같이 HttpError로 올린다.
+        """
+        async def send() -> Dict[str, Any]:
+            session = self.get_session()
+            async with session.get(request.uri) as response:
+                body = await response.read()
+                if response.status != 200:
+                    raise self._http_error(response, body, request.uri)
+                return orjson.loads(body)
+        
+        return await self._with_retry(send)
+    
+    async def _execute_batch(self, requests: List[Any]) -> List[Union[Dict[str, Any], HttpError]]:
+        """여러 GET 요청을 배치 엔드포인트(batchPath)에 multipart 요청 하나로 묶어 실행
+        
+        결과는 요청 순서대로 반환하며, 하위 요청이 실패하면 해당 위치에 HttpError를 담는다.
+        하위 요청은 최대 50개씩 나누어 보낸다.
+        """
+        if len(requests) == 1:
+            try:
+                return [await self._execute(requests[0])]
+            except HttpError as e:
+                return [e]
+        groups = [requests[i:i + _BATCH_MAX_PARTS] for i in range(0, len(requests), _BATCH_MAX_PARTS)]
+        results: List[Union[Dict[str, Any], HttpError]] = []
+        for group_results in await asyncio.gather(*(self._post_batch(group) for group in groups)):
+            results.extend(group_results)
+        return results
+    
+    def _batch_uri(self) -> str:
+        """배치 엔드포인트 (디스커버리 문서의 batchPath를 클라이언트 API 호스트에 연결)
+        
+        api_endpoint로 호스트를 바꾼 클라이언트도 같은 호스트의 배치 경로로 보낸다.
+        """
+        base = urlsplit(self.youtube._baseUrl)
+        batch_path = self.youtube._rootDesc.get("batchPath", "batch")
+        return f"{base.scheme}://{base.netloc}/{batch_path.lstrip('/')}"
+    
+    async def _post_batch(self, requests: List[Any]) -> List[Union[Dict[str, Any], HttpError]]:
+        """하위 요청 묶음 하나를 multipart/mixed로 전송하고 응답을 분리"""
+        batch_uri = self._batch_uri()
+        boundary = uuid.uuid4().hex
+        
+        parts = []
+        for index, request in enumerate(requests):
+            target = urlsplit(request.uri)
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                "Content-Transfer-Encoding: binary\r\n"
+                f"Content-ID: <{index}>\r\n\r\n"
+                f"GET {target.path}?{target.query} HTTP/1.1\r\n\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+        body = "".join(parts).encode("utf-8")
+        
+        async def send() -> Tuple[bytes, str]:
+            session = self.get_session()
+            headers = {"Content-Type": f"multipart/mixed; boundary={boundary}"}
+            async with session.post(batch_uri, data=body, headers=headers) as response:
+                content = await response.read()
+                if response.status >= 300:
+                    raise self._http_error(response, content, batch_uri)
+                return content, response.headers.get("Content-Type", "")
+        
+        content, content_type = await self._with_retry(send)
+        
+        # 응답 Content-Type 헤더를 앞에 붙여 multipart 메시지로 파싱
+        parser = FeedParser()
+        parser.feed(f"content-type: {content_type}\r\n\r\n")
+        parser.feed(content.decode("utf-8"))
+        message = parser.close()
+        if not message.is_multipart():
+            raise Exception("YouTube 배치 응답 형식 오류: multipart/mixed가 아닙니다.")
+        
+        results: List[Union[Dict[str, Any], HttpError]] = [
+            HttpError(httplib2.Response({"status": 500, "reason": "Missing"}), b"", uri=r.uri) for r in requests
+        ]
+        for part in message.get_payload():
+            # 형식이 잘못된 하위 응답은 해당 위치만 기본 오류(500)로 남기고 나머지는 그대로 처리
+            parsed = self._parse_batch_part(part, len(requests))
+            if parsed is None:
+                self.logger.warning("YouTube 배치 하위 응답 형식 오류, 해당 요청은 실패로 처리합니다.")
+                continue
+            index, status, reason, sub_body = parsed
+            if status == 200:
+                try:
+                    # orjson은 str도 직접 파싱하므로 바이트로 다시 인코딩하지 않는다
+                    results[index] = orjson.loads(sub_body)
+                except orjson.JSONDecodeError:
+                    self.logger.warning(f"YouTube 배치 하위 응답 JSON 파싱 실패 (요청 {index})")
+            else:
+                resp = httplib2.Response({"status": status, "reason": reason})
+                results[index] = HttpError(resp, sub_body.encode("utf-8"), uri=requests[index].uri)
+        return results
+    
+    @staticmethod
+    def _parse_batch_part(part, size: int) -> Optional[Tuple[int, int, str, str]]:
+        """배치 응답 하위 파트에서 (요청 위치, 상태 코드, 사유, 본문) 추출 (형식이 잘못되면 None)"""
+        # Content-ID: <response-N>
+        content_id = part["Content-ID"]
+        payload = part.get_payload()
+        if not content_id or not isinstance(payload, str):
+            return None
+        try:
+            index = int(content_id.strip().strip("<>").rsplit("-", 1)[-1])
+            status_line, rest = payload.split("\n", 1)
+            _, status, *reason = status_line.strip().split(" ", 2)
+            status_code = int(status)
+        except ValueError:
+            return None
+        if not 0 <= index < size:
+            return None
+        sub_body = _BATCH_HEADER_END_RE.split(rest, 1)[-1]
+        return index, status_code, reason[0] if reason else "", sub_body
     
     async def get_trending_videos(self, region_code: str = "KR", 
                                 category_id: Optional[str] = None,
@@ -45,6 +391,47 @@ class YouTubeService(BaseSocialMediaService):
         if not self.youtube:
             raise Exception("YouTube API 클라이언트가 초기화되지 않았습니다.")
         
+        # 캐시는 원본 항목만 보관하고 응답 모델은 호출마다 새로 만든다
+        # (호출 측이 결과를 변경해도 다른 호출이나 캐시에 영향이 없음)
+        videos = await self._get_trending_raw(region_code, category_id, max_results)
+        return list(self._iter_trends(videos))
+    
+    async def iter_trending_videos(self, region_code: str = "KR",
+                                   category_id: Optional[str] = None,
+                                   max_results: int = 25) -> AsyncIterator[TrendResponse]:
+        """YouTube 인기 동영상을 하나씩 변환하며 반환
+        
+        전체 목록을 만들지 않고 응답 항목을 순서대로 변환하므로, 결과를 한 번 훑기만 하는
+        호출 측은 변환과 후속 처리를 겹쳐 진행할 수 있다. 원본 항목은 목록 조회와 같은 캐시를 사용한다.
+        """
+        if not self.youtube:
+            raise Exception("YouTube API 클라이언트가 초기화되지 않았습니다.")
+        
+        for trend in self._iter_trends(await self._get_trending_raw(region_code, category_id, max_results)):
+            yield trend
+    
+    async def _get_trending_raw(self, region_code: str, category_id: Optional[str],
+                                max_results: int) -> Tuple[Dict[str, Any], ...]:
+        """YouTube 인기 동영상 원본 항목 조회 (캐시 사용)
+        
+        인기 동영상 변환과 해시태그 집계가 같은 videos.list 응답을 공유한다.
+        """
+        return await self._cached(
+            self._trending_cache,
+            ("trending_raw", region_code, category_id, max_results),
+            lambda: self._fetch_trending_raw(region_code, category_id, max_results),
+        )
+    
+    async def _fetch_trending_raw(self, region_code: str, category_id: Optional[str],
+                                  max_results: int) -> Tuple[Dict[str, Any], ...]:
+        """원본 항목 API 호출 (캐시 미스 시)"""
+        videos = tuple(await self._request_trending_items(region_code, category_id, max_results))
+        self.log_response("trending_videos", len(videos))
+        return videos
+    
+    async def _request_trending_items(self, region_code: str, category_id: Optional[str],
+                                      max_results: int) -> List[Dict[str, Any]]:
+        """YouTube 인기 동영상 원본 항목 조회"""
         try:
             self.log_request("trending_videos", {
                 "region_code": region_code,
@@ -58,24 +445,12 @@ class YouTubeService(BaseSocialMediaService):
                 chart="mostPopular",
                 regionCode=region_code,
                 maxResults=min(max_results, 50),  # API 제한
-                videoCategoryId=category_id if category_id else None
+                videoCategoryId=category_id if category_id else None,
+                fields=_VIDEO_FIELDS
             )
             
-            response = request.execute()
-            videos = response.get('items', [])
-            
-            # 결과 변환
-            trends = []
-            for video in videos:
-                try:
-                    trend = self._convert_video_to_trend(video)
-                    trends.append(trend)
-                except Exception as e:
-                    self.logger.warning(f"동영상 변환 실패: {str(e)}")
-                    continue
-            
-            self.log_response("trending_videos", len(trends))
-            return trends
+            response = await self._execute(request)
+            return response.get('items', [])
             
         except HttpError as e:
             error_msg = f"YouTube API 오류: {e.resp.status} - {e.content.decode()}"
@@ -85,6 +460,14 @@ class YouTubeService(BaseSocialMediaService):
             self.log_error("trending_videos", e)
             raise
     
+    def _iter_trends(self, videos: List[Dict[str, Any]]) -> Iterator[TrendResponse]:
+        """원본 항목을 TrendResponse로 하나씩 변환 (변환 실패 항목은 건너뜀)"""
+        for video in videos:
+            try:
+                yield self._convert_video_to_trend(video)
+            except Exception as e:
+                self.logger.warning(f"동영상 변환 실패: {str(e)}")
+    
     async def search_videos(self, query: str, max_results: int = 25, 
                           order: str = "relevance") -> List[SearchResponse]:
         """YouTube 동영상 검색"""
@@ -104,22 +487,24 @@ class YouTubeService(BaseSocialMediaService):
                 q=query,
                 type="video",
                 order=order,
-                maxResults=min(max_results, 50)
+                maxResults=min(max_results, 50),
+                fields=_SEARCH_ID_FIELDS
             )
             
-            search_response = search_request.execute()
-            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+            search_response = await self._execute(search_request)
+            video_ids = self._unique_video_ids(search_response)
             
             if not video_ids:
                 return []
             
-            # 상세 정보 조회
+            # 상세 정보 조회 (검색 결과는 최대 50개이므로 한 번의 요청으로 처리)
             videos_request = self.youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=','.join(video_ids)
+                part="snippet,statistics",
+                id=','.join(video_ids),
+                fields=_SEARCH_VIDEO_FIELDS
             )
             
-            videos_response = videos_request.execute()
+            videos_response = await self._execute(videos_request)
             videos = videos_response.get('items', [])
             
             # 결과 변환
@@ -148,6 +533,25 @@ class YouTubeService(BaseSocialMediaService):
         if not self.youtube:
             raise Exception("YouTube API 클라이언트가 초기화되지 않았습니다.")
         
+        channel_info = await self._cached(
+            self._channel_cache,
+            ("channel", channel_id),
+            lambda: self._fetch_channel_info(channel_id),
+        )
+        return channel_info.model_copy()
+    
+    async def _fetch_channel_info(self, channel_id: str) -> ChannelResponse:
+        """YouTube 채널 정보 API 호출 (캐시 미스 시)"""
+        store_key = f"yt:channel:{channel_id}"
+        if self._store is not None:
+            try:
+                stored = await asyncio.to_thread(self._store.get, store_key)
+            except Exception as e:
+                self.logger.warning(f"공유 캐시 조회 실패: {str(e)}")
+                stored = None
+            if stored is not None:
+                return ChannelResponse.model_validate(stored)
+        
         try:
             self.log_request("channel_info", {"channel_id": channel_id})
             
@@ -156,7 +560,7 @@ class YouTubeService(BaseSocialMediaService):
                 id=channel_id
             )
             
-            response = request.execute()
+            response = await self._execute(request)
             channels = response.get('items', [])
             
             if not channels:
@@ -170,17 +574,24 @@ class YouTubeService(BaseSocialMediaService):
                 id=channel_id,
                 name=snippet.get('title', ''),
                 description=snippet.get('description', ''),
-                url=f"https://www.youtube.com/channel/{channel_id}",
+                url=_CHANNEL_URL + channel_id,
                 avatar_url=snippet.get('thumbnails', {}).get('default', {}).get('url'),
                 platform="youtube",
                 follower_count=self.safe_int(statistics.get('subscriberCount')),
                 following_count=None,  # YouTube는 following_count를 제공하지 않음
                 post_count=self.safe_int(statistics.get('videoCount')),
                 verified=snippet.get('verified', False),
-                created_at=datetime.fromisoformat(snippet.get('publishedAt', '').replace('Z', '+00:00')) if snippet.get('publishedAt') else None
+                created_at=self.parse_datetime(snippet.get('publishedAt'))
             )
             
             self.log_response("channel_info", 1)
+            if self._store is not None:
+                try:
+                    await asyncio.to_thread(
+                        self._store.set, store_key, channel_info.model_dump(mode="json"), _CHANNEL_STORE_TTL
+                    )
+                except Exception as e:
+                    self.logger.warning(f"공유 캐시 저장 실패: {str(e)}")
             return channel_info
             
         except HttpError as e:
@@ -195,36 +606,35 @@ class YouTubeService(BaseSocialMediaService):
         """YouTube 인기 해시태그 조회 (제한적)"""
         # YouTube는 공식적으로 해시태그 트렌드를 제공하지 않으므로
         # 인기 동영상에서 해시태그를 추출하는 방식으로 구현
+        if not self.youtube:
+            # API 클라이언트가 없으면(키 미설정 등) 집계할 영상이 없으므로 오류 기록 없이 빈 결과
+            return []
+        
         try:
-            trending_videos = await self.get_trending_videos(max_results=50)
-            
-            # 해시태그 수집
-            hashtag_count = {}
-            for video in trending_videos:
-                if video.hashtags:
-                    for hashtag in video.hashtags:
-                        hashtag_count[hashtag] = hashtag_count.get(hashtag, 0) + 1
-            
-            # 인기 순으로 정렬
-            sorted_hashtags = sorted(hashtag_count.items(), key=lambda x: x[1], reverse=True)
-            
-            # 결과 변환
-            hashtags = []
-            for hashtag, count in sorted_hashtags[:max_results]:
-                hashtags.append(HashtagResponse(
-                    hashtag=hashtag,
-                    post_count=count,
-                    view_count=None,  # YouTube 해시태그는 개별 조회수를 제공하지 않음
-                    platform="youtube",
-                    trending_score=count / len(trending_videos) if trending_videos else 0,
-                    related_hashtags=None  # 관련 해시태그 정보는 별도 분석 필요
-                ))
-            
-            return hashtags
-            
+            # TrendResponse를 만들지 않고 원본 항목에서 해시태그만 바로 추출
+            trending_videos = await self._get_trending_raw("KR", None, 50)
         except Exception as e:
+            # 인기 동영상을 가져오지 못하면 집계할 해시태그가 없으므로 빈 결과로 처리
             self.log_error("trending_hashtags", e)
-            raise
+            return []
+        
+        # 해시태그 수집 후 인기 순 정렬 (동률은 처음 등장한 순서 유지)
+        hashtag_count = Counter(chain.from_iterable(map(self._video_hashtags, trending_videos)))
+        
+        # 결과 변환 (해시태그가 있으면 영상 수는 1 이상이므로 0으로 나누지 않음)
+        total = len(trending_videos)
+        hashtags = []
+        for hashtag, count in hashtag_count.most_common(max_results):
+            hashtags.append(HashtagResponse(
+                hashtag=hashtag,
+                post_count=count,
+                view_count=None,  # YouTube 해시태그는 개별 조회수를 제공하지 않음
+                platform="youtube",
+                trending_score=count / total,
+                related_hashtags=None  # 관련 해시태그 정보는 별도 분석 필요
+            ))
+        
+        return hashtags
 
     # ==================== 분석 기능 ====================
     async def analyze(self, req: YouTubeAnalyzeRequest) -> YouTubeAnalyzeResponse:
@@ -232,58 +642,45 @@ class YouTubeService(BaseSocialMediaService):
         if not self.youtube:
             raise Exception("YouTube API 클라이언트가 초기화되지 않았습니다.")
 
-        collected: List[YouTubeAnalyzeRow] = []
-
         # 1) 수집 대상 결정
         do_channel = req.mode in ("channel", "both") and req.channel_handles
         do_keyword = req.mode in ("keyword", "both") and req.keywords
 
-        # 2) 채널 단위 수집
-        if do_channel:
-            for handle in req.channel_handles or []:
-                try:
-                    channel_id = await self._resolve_channel_id_by_handle(handle)
-                    videos = await self._fetch_recent_videos_by_channel(
-                        channel_id=channel_id,
-                        max_results=req.max_per_channel,
-                        region_code=req.region,
-                    )
-                    rows = [self._to_analyze_row(v) for v in videos]
-                    collected.extend(rows)
-                except Exception as e:
-                    self.log_error("analyze_channel", e)
+        # 기준 시각은 호출당 한 번만 구해 모든 행의 시간당 조회수와 기간 필터에 같이 사용
+        now_ts = time.time()
 
-        # 3) 키워드 단위 수집
+        # 2) 채널/키워드 단위 수집 (서로 독립적이므로 동시에 요청, 결과는 요청 순서대로 합침)
+        tasks = []
+        if do_channel:
+            tasks.extend(self._collect_channel(handle, req, now_ts) for handle in req.channel_handles or [])
         if do_keyword:
-            for keyword in req.keywords or []:
-                try:
-                    results = await self.search_videos(keyword, max_results=req.max_per_keyword, order="date")
-                    rows = [self._to_analyze_row_from_search(r) for r in results]
-                    collected.extend(rows)
-                except Exception as e:
-                    self.log_error("analyze_keyword", e)
+            tasks.extend(self._collect_keyword(keyword, req, now_ts) for keyword in req.keywords or [])
+        collected: List[_AnalyzeEntry] = [
+            entry for entries in await asyncio.gather(*tasks) for entry in entries
+        ]
 
-        # 4) 기간/폼 필터링
-        collected = self._filter_by_time_and_form(
-            rows=collected,
+        # 3) 기간/폼 필터링과 최소 조건 필터링을 한 번의 순회로 처리
+        #    (조회수/시간당 조회수는 보강 결과와 무관하므로 보강 전에 걸러 조회할 채널을 줄인다)
+        total = 0
+        filtered_rows: List[YouTubeAnalyzeRow] = []
+        min_view_count = req.min_view_count
+        min_views_per_hour = req.min_views_per_hour
+        for row in self._iter_by_time_and_form(
+            entries=collected,
             timeframe_days=req.timeframe_days,
             form=req.form,
             shorts_threshold=req.shorts_threshold_seconds,
-        )
-
-        # 5) 통계 정보(구독자, 조회/구독 비율) 보강
-        collected = await self._enrich_with_channel_stats(collected)
-
-        # 6) 최소 조건 필터링
-        filtered_rows = []
-        for row in collected:
+            now_ts=now_ts,
+        ):
+            total += 1
             if row.view_count is None:
                 continue
-            views_ok = row.view_count >= req.min_view_count
-            vph_ok = (row.views_per_hour or 0) >= req.min_views_per_hour
-            if views_ok and vph_ok:
+            if row.view_count >= min_view_count and (row.views_per_hour or 0) >= min_views_per_hour:
                 filtered_rows.append(row)
 
+        # 4) 통계 정보(구독자, 조회/구독 비율) 보강
+        filtered_rows = await self._enrich_with_channel_stats(filtered_rows)
+
         settings_summary = {
             "mode": req.mode,
             "form": req.form,
@@ -299,18 +696,52 @@ class YouTubeService(BaseSocialMediaService):
 
         return YouTubeAnalyzeResponse(
             rows=filtered_rows,
-            total=len(collected),
+            total=total,
             filtered=len(filtered_rows),
             settings=settings_summary,
         )
 
     # -------------------- 내부 유틸 --------------------
+    async def _collect_channel(self, handle: str, req: YouTubeAnalyzeRequest,
+                               now_ts: Optional[float] = None) -> List[_AnalyzeEntry]:
+        """채널 핸들 하나의 최근 영상 수집 (실패 시 기록 후 빈 목록)"""
+        try:
+            channel_id = await self._resolve_channel_id_by_handle(handle)
+            videos = await self._fetch_recent_videos_by_channel(
+                channel_id=channel_id,
+                max_results=req.max_per_channel,
+                region_code=req.region,
+            )
+            return [self._to_analyze_entry(v, now_ts) for v in videos]
+        except Exception as e:
+            self.log_error("analyze_channel", e)
+            return []
+
+    async def _collect_keyword(self, keyword: str, req: YouTubeAnalyzeRequest,
+                               now_ts: Optional[float] = None) -> List[_AnalyzeEntry]:
+        """키워드 하나의 최신 검색 결과 수집 (실패 시 기록 후 빈 목록)"""
+        try:
+            # 검색 결과 모델에는 길이/채널 ID가 없어 폼 필터와 구독자 보강이 빠지므로 원본 상세정보로 변환
+            videos = await self._fetch_recent_videos_by_keyword(keyword, max_results=req.max_per_keyword)
+            return [self._to_analyze_entry(v, now_ts) for v in videos]
+        except Exception as e:
+            self.log_error("analyze_keyword", e)
+            return []
+
     async def _resolve_channel_id_by_handle(self, handle: str) -> str:
-        """@handle -> channelId 해석"""
+        """@handle -> channelId 해석 (핸들-채널 매핑은 거의 바뀌지 않으므로 7일간 보관)"""
         handle = handle.strip().lstrip("@")
+        return await self._cached(
+            self._handle_cache,
+            ("handle", handle),
+            lambda: self._search_channel_id(handle),
+        )
+
+    async def _search_channel_id(self, handle: str) -> str:
+        """search.list로 핸들의 channelId 조회 (캐시 미스 시)"""
         try:
             req = self.youtube.search().list(part="snippet", q=f"@{handle}", type="channel", maxResults=1)
-            res = req.execute()
+            res = await self._execute(req)
             items = res.get("items", [])
             if not items:
                 raise Exception(f"채널 핸들을 찾을 수 없음: {handle}")
@@ -321,142 +752,99 @@ class YouTubeService(BaseSocialMediaService):
 
     async def _fetch_recent_videos_by_channel(self, channel_id: str, max_results: int, region_code: str) -> List[Dict[str, Any]]:
         """채널의 최신 영상 조회 후 상세정보 반환"""
-        # 채널 업로드 플레이리스트 조회 -> 최신 영상 검색
+        return await self._search_recent_videos(max_results, channelId=channel_id, regionCode=region_code)
+
+    async def _fetch_recent_videos_by_keyword(self, keyword: str, max_results: int) -> List[Dict[str, Any]]:
+        """키워드의 최신 영상 조회 후 상세정보(길이/채널 ID/통계 포함) 반환"""
+        return await self._search_recent_videos(max_results, q=keyword)
+
+    async def _search_recent_videos(self, max_results: int, **search_params: Any) -> List[Dict[str, Any]]:
+        """최신순 검색으로 영상 ID를 모은 뒤 한 번의 videos.list로 상세정보 조회"""
         search_req = self.youtube.search().list(
             part="snippet",
-            channelId=channel_id,
             type="video",
             order="date",
-            regionCode=region_code,
             maxResults=min(max_results, 50),
+            fields=_SEARCH_ID_FIELDS,
+            **search_params,
         )
-        search_res = search_req.execute()
-        video_ids = [i["id"]["videoId"] for i in search_res.get("items", [])]
+        search_res = await self._execute(search_req)
+        video_ids = self._unique_video_ids(search_res)
         if not video_ids:
             return []
-        videos_req = self.youtube.videos().list(part="snippet,statistics,contentDetails", id=",".join(video_ids))
-        videos_res = videos_req.execute()
+        videos_req = self.youtube.videos().list(
+            part="snippet,statistics,contentDetails",
+            id=",".join(video_ids),
+            fields=_VIDEO_FIELDS,
+        )
+        videos_res = await self._execute(videos_req)
         return videos_res.get("items", [])
 
-    def _to_analyze_row(self, video: Dict[str, Any]) -> YouTubeAnalyzeRow:
-        snippet = video.get("snippet", {})
-        statistics = video.get("statistics", {})
-        content_details = video.get("contentDetails", {})
-        published_at = snippet.get("publishedAt")
-        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00')) if published_at else None
-        view_count = self.safe_int(statistics.get("viewCount"))
-        views_per_hour = None
-        if dt and view_count is not None:
-            hours = max((datetime.now(dt.tzinfo) - dt).total_seconds() / 3600, 1e-6)
-            views_per_hour = round(view_count / hours, 2)
-        duration = self.parse_duration(content_details.get("duration", ""))
-        video_id = video.get("id", "") if isinstance(video.get("id"), str) else video.get("id", {}).get("videoId", "")
-        return YouTubeAnalyzeRow(
+    @staticmethod
+    def _unique_video_ids(search_response: Dict[str, Any]) -> List[str]:
+        """검색 응답의 영상 ID (중복 제거, 순서 유지)
+        
+        정렬/페이지에 따라 같은 영상이 반복될 수 있어 videos.list 요청 크기와 쿼터를 줄인다.
+        """
+        return list(dict.fromkeys(
+            video_id for item in search_response.get('items', [])
+            if (video_id := item.get('id', _EMPTY).get('videoId'))
+        ))
+
+    def _to_analyze_entry(self, video: Dict[str, Any], now_ts: Optional[float] = None) -> _AnalyzeEntry:
+        """분석 행과 필터용 값(업로드 시각 epoch 초, 초 단위 영상 길이) 반환
+        
+        필터가 datetime/길이 문자열을 다시 처리하지 않도록 변환 시 계산한 값을 행과 함께 넘긴다
+        (모델 private 속성 접근은 일반 필드보다 훨씬 느림).
+        """
+        # 행마다 반복되는 경로라서 조회 메서드를 지역 변수로 묶고 빈 dict는 공유 상수를 쓴다
+        snippet_get = video.get("snippet", _EMPTY).get
+        dt = self.parse_datetime(snippet_get("publishedAt"))
+        published_ts = dt.timestamp() if dt else None
+        view_count = self.safe_int(video.get("statistics", _EMPTY).get("viewCount"))
+        views_per_hour = self._views_per_hour(view_count, published_ts, now_ts)
+        raw_duration = video.get("contentDetails", _EMPTY).get("duration", "")
+        duration_seconds = self._iso_duration_seconds(raw_duration)
+        duration = self._format_seconds(duration_seconds) if raw_duration else ""
+        raw_id = video.get("id", "")
+        video_id = raw_id if isinstance(raw_id, str) else raw_id.get("videoId", "")
+        row = YouTubeAnalyzeRow(
             video_id=video_id,
-            channel_id=snippet.get("channelId"),
-            channel_name=snippet.get("channelTitle", ""),
-            title=snippet.get("title", ""),
+            channel_id=snippet_get("channelId"),
+            channel_name=snippet_get("channelTitle", ""),
+            title=snippet_get("title", ""),
             published_at=dt,
             view_count=view_count,
             views_per_hour=views_per_hour,
             subscriber_count=None,
             view_to_subscriber_ratio=None,
             duration=duration,
-            video_url=f"https://www.youtube.com/watch?v={video_id}",
-            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url"),
+            video_url=_WATCH_URL + video_id,
+            thumbnail_url=snippet_get("thumbnails", _EMPTY).get("high", _EMPTY).get("url"),
         )
+        return row, published_ts, duration_seconds
 
-    def _to_analyze_row_from_search(self, search: Dict[str, Any] | SearchResponse) -> YouTubeAnalyzeRow:
-        # SearchResponse 또는 dict 지원
-        if hasattr(search, 'dict'):
-            data = search.dict()
-            video_id = data.get('id')
-            view_count = data.get('view_count')
-            published_at = data.get('published_at')
-            dt = published_at
-            if isinstance(published_at, str):
-                try:
-                    dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                except Exception:
-                    dt = None
-            views_per_hour = None
-            if dt and view_count is not None:
-                hours = max((datetime.now(dt.tzinfo) - dt).total_seconds() / 3600, 1e-6)
-                views_per_hour = round(view_count / hours, 2)
-            return YouTubeAnalyzeRow(
-                video_id=video_id,
-                channel_id=None,
-                channel_name=data.get('author') or '',
-                title=data.get('title') or '',
-                published_at=dt,
-                view_count=view_count,
-                views_per_hour=views_per_hour,
-                subscriber_count=None,
-                view_to_subscriber_ratio=None,
-                duration=None,
-                video_url=f"https://www.youtube.com/watch?v={video_id}",
-                thumbnail_url=data.get('thumbnail_url'),
-            )
-        else:
-            # dict (search API 원본)
-            vid = search.get('id', {}).get('videoId')
-            snippet = search.get('snippet', {})
-            dt = None
-            if snippet.get('publishedAt'):
-                try:
-                    dt = datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00'))
-                except Exception:
-                    dt = None
-            return YouTubeAnalyzeRow(
-                video_id=vid or '',
-                channel_id=snippet.get('channelId'),
-                channel_name=snippet.get('channelTitle', ''),
-                title=snippet.get('title', ''),
-                published_at=dt,
-                view_count=None,
-                views_per_hour=None,
-                subscriber_count=None,
-                view_to_subscriber_ratio=None,
-                duration=None,
-                video_url=f"https://www.youtube.com/watch?v={vid}",
-                thumbnail_url=snippet.get('thumbnails', {}).get('high', {}).get('url'),
-            )
-
-    def _filter_by_time_and_form(self, rows: List[YouTubeAnalyzeRow], timeframe_days: int, form: str, shorts_threshold: int) -> List[YouTubeAnalyzeRow]:
-        threshold_dt = datetime.now().astimezone() - timedelta(days=timeframe_days)
-        result: List[YouTubeAnalyzeRow] = []
-        for r in rows:
-            if r.published_at and r.published_at < threshold_dt:
+    def _iter_by_time_and_form(self, entries: List[_AnalyzeEntry], timeframe_days: int, form: str,
+                               shorts_threshold: int, now_ts: Optional[float] = None) -> Iterator[YouTubeAnalyzeRow]:
+        """기간/폼 조건을 통과한 행을 순서대로 반환 (중간 목록 없이 다음 단계와 이어서 처리)"""
+        threshold_ts = (time.time() if now_ts is None else now_ts) - timeframe_days * 86400
+        for r, published_ts, duration_seconds in entries:
+            # 업로드 시각이 없으면 기간 필터를 적용하지 않음
+            if published_ts is not None and published_ts < threshold_ts:
                 continue
             # 폼 필터
-            if form != 'both' and r.duration is not None:
-                # duration 형식 m:ss 또는 h:mm:ss => 초로 변환
-                total_seconds = self._duration_to_seconds(r.duration)
-                is_shorts = total_seconds <= shorts_threshold
+            if form != 'both':
+                is_shorts = duration_seconds <= shorts_threshold
                 if form == 'shorts' and not is_shorts:
                     continue
                 if form == 'long' and is_shorts:
                     continue
-            result.append(r)
-        return result
+            yield r
 
     async def _enrich_with_channel_stats(self, rows: List[YouTubeAnalyzeRow]) -> List[YouTubeAnalyzeRow]:
-        # 채널별로 구독자 수를 조회하여 비율 계산
+        # 채널별로 구독자 수를 조회하여 비율 계산 (메모리/공유 캐시에 없는 채널만 API로 조회)
         channel_ids = list({r.channel_id for r in rows if r.channel_id})
-        id_to_subs: Dict[str, Optional[int]] = {}
-        for chunk_start in range(0, len(channel_ids), 50):
-            chunk = channel_ids[chunk_start:chunk_start+50]
-            if not chunk:
-                continue
-            try:
-                req = self.youtube.channels().list(part="statistics", id=",".join(chunk))
-                res = req.execute()
-                for item in res.get('items', []):
-                    cid = item.get('id')
-                    subs = self.safe_int(item.get('statistics', {}).get('subscriberCount'))
-                    id_to_subs[cid] = subs
-            except Exception as e:
-                self.log_error("enrich_channel_stats", e)
+        id_to_subs = await self._load_subscriber_counts(channel_ids)
         # 반영
         for r in rows:
             if r.channel_id and r.channel_id in id_to_subs:
@@ -465,78 +853,168 @@ class YouTubeService(BaseSocialMediaService):
                     r.view_to_subscriber_ratio = round(r.view_count / max(r.subscriber_count, 1), 2)
         return rows
 
-    def _duration_to_seconds(self, duration_str: str) -> int:
-        if not duration_str:
-            return 0
-        parts = duration_str.split(':')
+    async def _load_subscriber_counts(self, channel_ids: List[str]) -> Dict[str, Optional[int]]:
+        """채널 ID -> 구독자 수 (메모리 캐시 -> 공유 캐시 -> channels.list 순으로 조회)
+
+        구독자 수를 숨긴 채널(None)도 결과로 보관해 다시 조회하지 않는다.
+        """
+        id_to_subs: Dict[str, Optional[int]] = {}
+        missing: List[str] = []
+        for channel_id in channel_ids:
+            if channel_id in self._subscriber_cache:
+                id_to_subs[channel_id] = self._subscriber_cache[channel_id]
+            else:
+                missing.append(channel_id)
+
+        if missing and self._store is not None:
+            try:
+                stored = await asyncio.to_thread(
+                    self._store.get_many, [f"yt:subs:{channel_id}" for channel_id in missing]
+                )
+            except Exception as e:
+                self.logger.warning(f"공유 캐시 조회 실패: {str(e)}")
+                stored = {}
+            if stored:
+                still_missing = []
+                for channel_id in missing:
+                    key = f"yt:subs:{channel_id}"
+                    if key in stored:
+                        id_to_subs[channel_id] = self._subscriber_cache[channel_id] = stored[key]
+                    else:
+                        still_missing.append(channel_id)
+                missing = still_missing
+
+        if not missing:
+            return id_to_subs
+
+        # 50개 단위 조회를 하나의 배치 요청으로 묶음
+        requests = [
+            self.youtube.channels().list(part="statistics", id=",".join(missing[i:i + _CHANNEL_BATCH_SIZE]))
+            for i in range(0, len(missing), _CHANNEL_BATCH_SIZE)
+        ]
         try:
-            if len(parts) == 3:
-                h, m, s = parts
-                return int(h) * 3600 + int(m) * 60 + int(s)
-            if len(parts) == 2:
-                m, s = parts
-                return int(m) * 60 + int(s)
-            return int(parts[0])
-        except Exception:
+            responses = await self._execute_batch(requests)
+        except Exception as e:
+            self.log_error("enrich_channel_stats", e)
+            responses = []
+        fetched: Dict[str, Optional[int]] = {}
+        for res in responses:
+            if isinstance(res, Exception):
+                self.log_error("enrich_channel_stats", res)
+                continue
+            for item in res.get('items', []):
+                fetched[item.get('id')] = self.safe_int(item.get('statistics', _EMPTY).get('subscriberCount'))
+
+        self._subscriber_cache.update(fetched)
+        id_to_subs.update(fetched)
+        if fetched and self._store is not None:
+            try:
+                await asyncio.to_thread(
+                    self._store.set_many,
+                    {f"yt:subs:{channel_id}": subs for channel_id, subs in fetched.items()},
+                    _SUBSCRIBER_CACHE_TTL,
+                )
+            except Exception as e:
+                self.logger.warning(f"공유 캐시 저장 실패: {str(e)}")
+        return id_to_subs
+
+    @staticmethod
+    def _views_per_hour(view_count: Optional[int], published_ts: Optional[float],
+                        now_ts: Optional[float] = None) -> Optional[float]:
+        """업로드 후 경과 시간 대비 조회수 (epoch 초 단위 실수 연산, 기준 시각이 없으면 현재 시각)"""
+        if published_ts is None or view_count is None:
+            return None
+        hours = max(((time.time() if now_ts is None else now_ts) - published_ts) / 3600, 1e-6)
+        return round(view_count / hours, 2)
+
+    @staticmethod
+    def _iso_duration_seconds(value: str) -> int:
+        """ISO 8601 영상 길이(P#DT#H#M#S)를 초 단위 정수로 변환 (형식이 다르면 0)"""
+        match = _ISO_DUR_RE.match(value) if value else None
+        if not match:
             return 0
+        days, hours, minutes, seconds = match.groups()
+        return int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0)
+
+    @staticmethod
+    def _format_seconds(total_seconds: int) -> str:
+        """초 단위 길이를 parse_duration과 같은 h:mm:ss / m:ss 형식으로 변환"""
+        hours, rest = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+        if hours > 0:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
+
+    def _parse_common(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """TrendResponse/SearchResponse 공통 필드 추출
+        
+        같은 영상이 인기/검색 결과에 반복 등장하므로 (id, etag)로 결과를 보관한다.
+        etag가 바뀌면(내용 변경) 다시 계산하며, etag가 없는 응답은 보관하지 않는다.
+        """
+        etag = video.get('etag')
+        key = (video.get('id'), etag)
+        common = self._common_cache.get(key) if etag else None
+        if common is None:
+            common = self._build_common(video)
+            if etag:
+                self._common_cache[key] = common
+        # 보관본이 응답 모델을 통해 변경되지 않도록 해시태그 목록은 새로 만들어 전달
+        return {**common, 'hashtags': list(common['hashtags'])}
+    
+    def _build_common(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """공통 필드 계산 (해시태그는 튜플로 보관)
+        
+        영상마다 반복되는 경로라서 조회 메서드를 지역 변수로 묶고 빈 dict는 공유 상수를 쓴다.
+        """
+        snippet_get = video.get('snippet', _EMPTY).get
+        statistics_get = video.get('statistics', _EMPTY).get
+        safe_int = self.safe_int
+        
+        description = snippet_get('description', '')
+        title = snippet_get('title', '')
+        video_id = video.get('id', '')
+        
+        return {
+            'id': video_id,
+            'title': title,
+            'description': self.truncate_text(description),
+            'url': _WATCH_URL + video_id,
+            'thumbnail_url': snippet_get('thumbnails', _EMPTY).get('high', _EMPTY).get('url'),
+            'platform': "youtube",
+            'author': snippet_get('channelTitle', ''),
+            'author_url': _CHANNEL_URL + snippet_get('channelId', ''),
+            'view_count': safe_int(statistics_get('viewCount')),
+            'like_count': safe_int(statistics_get('likeCount')),
+            'comment_count': safe_int(statistics_get('commentCount')),
+            'published_at': self.parse_datetime(snippet_get('publishedAt')),
+            'tags': None,  # YouTube는 태그를 API로 제공하지 않음
+            'hashtags': tuple(self._video_hashtags(video)),
+        }
+    
+    def _video_hashtags(self, video: Dict[str, Any]) -> List[str]:
+        """원본 항목의 해시태그 (설명 → 제목 순, 중복은 처음 등장한 순서로 한 번만)"""
+        snippet_get = video.get('snippet', _EMPTY).get
+        extract_hashtags = self.extract_hashtags
+        return list(dict.fromkeys(
+            extract_hashtags(snippet_get('description', '')) + extract_hashtags(snippet_get('title', ''))
+        ))
     
     def _convert_video_to_trend(self, video: Dict[str, Any]) -> TrendResponse:
         """YouTube API 응답을 TrendResponse로 변환"""
-        snippet = video.get('snippet', {})
-        statistics = video.get('statistics', {})
-        content_details = video.get('contentDetails', {})
-        
-        # 해시태그 추출
-        description = snippet.get('description', '')
-        title = snippet.get('title', '')
-        hashtags = self.extract_hashtags(description + ' ' + title)
+        snippet_get = video.get('snippet', _EMPTY).get
         
         return TrendResponse(
-            id=video.get('id', ''),
-            title=snippet.get('title', ''),
-            description=self.truncate_text(snippet.get('description', '')),
-            url=f"https://www.youtube.com/watch?v={video.get('id', '')}",
-            thumbnail_url=snippet.get('thumbnails', {}).get('high', {}).get('url'),
-            platform="youtube",
-            author=snippet.get('channelTitle', ''),
-            author_url=f"https://www.youtube.com/channel/{snippet.get('channelId', '')}",
-            view_count=self.safe_int(statistics.get('viewCount')),
-            like_count=self.safe_int(statistics.get('likeCount')),
-            comment_count=self.safe_int(statistics.get('commentCount')),
+            **self._parse_common(video),
             share_count=None,  # YouTube API는 공유 수를 직접 제공하지 않음
-            published_at=datetime.fromisoformat(snippet.get('publishedAt', '').replace('Z', '+00:00')) if snippet.get('publishedAt') else None,
-            duration=self.parse_duration(content_details.get('duration', '')),
-            tags=None,  # YouTube는 태그를 API로 제공하지 않음
-            hashtags=hashtags,
-            category=snippet.get('categoryId', ''),
-            language=snippet.get('defaultLanguage', ''),
-            region=snippet.get('defaultAudioLanguage', '')
+            duration=self.parse_duration(video.get('contentDetails', _EMPTY).get('duration', '')),
+            category=snippet_get('categoryId', ''),
+            language=snippet_get('defaultLanguage', ''),
+            region=snippet_get('defaultAudioLanguage', '')
         )
     
     def _convert_video_to_search(self, video: Dict[str, Any]) -> SearchResponse:
         """YouTube API 응답을 SearchResponse로 변환"""
-        snippet = video.get('snippet', {})
-        statistics = video.get('statistics', {})
-        
-        # 해시태그 추출
-        description = snippet.get('description', '')
-        title = snippet.get('title', '')
-        hashtags = self.extract_hashtags(description + ' ' + title)
-        
         return SearchResponse(
-            id=video.get('id', ''),
-            title=snippet.get('title', ''),
-            description=self.truncate_text(snippet.get('description', '')),
-            url=f"https://www.youtube.com/watch?v={video.get('id', '')}",
-            thumbnail_url=snippet.get('thumbnails', {}).get('high', {}).get('url'),
-            platform="youtube",
-            author=snippet.get('channelTitle', ''),
-            author_url=f"https://www.youtube.com/channel/{snippet.get('channelId', '')}",
-            view_count=self.safe_int(statistics.get('viewCount')),
-            like_count=self.safe_int(statistics.get('likeCount')),
-            comment_count=self.safe_int(statistics.get('commentCount')),
-            published_at=datetime.fromisoformat(snippet.get('publishedAt', '').replace('Z', '+00:00')) if snippet.get('publishedAt') else None,
-            relevance_score=None,  # YouTube API는 관련도 점수를 제공하지 않음
-            tags=None,  # YouTube는 태그를 API로 제공하지 않음
-            hashtags=hashtags
-        ) 
\ No newline at end of file
+            **self._parse_common(video),
+            relevance_score=None  # YouTube API는 관련도 점수를 제공하지 않음
+        )
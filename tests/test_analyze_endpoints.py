@@ -106,3 +106,37 @@ async def test_analyze_failure_quota(monkeypatch):
         assert r.status_code == 500
 
 
+
+
+@pytest.mark.asyncio
+async def test_analyze_serializes_service_model(monkeypatch):
+    import main
+    from datetime import timezone
+    from models.response_models import YouTubeAnalyzeResponse, YouTubeAnalyzeRow
+
+    async def fake_analyze(req):
+        row = YouTubeAnalyzeRow(
+            video_id="1",
+            channel_id="UC1",
+            channel_name="채널A",
+            title="제목A",
+            published_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            view_count=10000,
+            views_per_hour=500.0,
+            duration="10:00",
+            video_url="https://www.youtube.com/watch?v=1",
+        )
+        return YouTubeAnalyzeResponse(rows=[row], total=1, filtered=1, settings={"mode": "keyword"})
+
+    monkeypatch.setattr(main.youtube_service, "analyze", fake_analyze)
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/youtube/analyze", json={"mode": "keyword", "keywords": ["테스트"]})
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    data = r.json()
+    assert data["rows"][0]["published_at"] == "2024-01-02T03:04:05Z"
+    assert data["rows"][0]["subscriber_count"] is None
+    assert (data["total"], data["filtered"]) == (1, 1)
@@ -1,3 +1,7 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 from services.base_service import BaseSocialMediaService
 
 
@@ -23,3 +27,50 @@ def test_text_utils_and_numbers():
     assert d.extract_hashtags("#Hi #hello world") == ["#hi", "#hello"]
 
 
+def test_extract_hashtags_returns_fresh_lists():
+    d = Dummy("dummy")
+    first = d.extract_hashtags("한글 #태그 #Tag")
+    first.append("#changed")
+    assert d.extract_hashtags("한글 #태그 #Tag") == ["#태그", "#tag"]
+    assert d.extract_hashtags("해시태그 없는 긴 설명 " * 100) == []
+
+
+def test_parse_datetime_formats():
+    d = Dummy("dummy")
+    yt = d.parse_datetime("2024-01-02T03:04:05Z")
+    ig = d.parse_datetime("2024-01-02T03:04:05+0000")
+    assert yt == ig
+    assert yt.utcoffset().total_seconds() == 0
+    assert (yt.year, yt.month, yt.day, yt.hour, yt.minute, yt.second) == (2024, 1, 2, 3, 4, 5)
+    assert d.parse_datetime(None) is None
+    assert d.parse_datetime("") is None
+
+
+def test_parse_datetime_without_ciso8601(monkeypatch):
+    import services.base_service as base
+    monkeypatch.setattr(base, "_parse_iso_datetime", None)
+    d = Dummy("dummy")
+    fixed = d.parse_datetime("2024-01-02T03:04:05+0000")
+    assert fixed == d.parse_datetime("2024-01-02T03:04:05Z")
+    assert fixed.utcoffset().total_seconds() == 0
+    # 고정 형식이 아니면 범용 파서로 처리
+    assert d.parse_datetime("2024-01-02T03:04:05.123+09:00").hour == 3
+
+
+@pytest.mark.asyncio
+async def test_make_request_parses_json():
+    async def handler(request):
+        return web.json_response({"data": [{"id": "1", "caption": "한글 #태그"}]})
+
+    app = web.Application()
+    app.router.add_get("/media", handler)
+    async with TestServer(app) as server:
+        d = Dummy("dummy")
+        try:
+            data = await d.make_request(str(server.make_url("/media")))
+            session = d.session
+            await d.make_request(str(server.make_url("/media")))
+            assert d.session is session  # 요청 간 세션 재사용
+        finally:
+            await d.close()
+    assert data == {"data": [{"id": "1", "caption": "한글 #태그"}]}
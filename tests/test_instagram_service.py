@@ -0,0 +1,117 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services.instagram_service import InstagramService
+
+
+def _media(i):
+    return {
+        "id": str(i),
+        "caption": f"게시물 {i} #Tag{i}",
+        "media_type": "IMAGE",
+        "permalink": f"https://www.instagram.com/p/{i}/",
+        "timestamp": "2024-01-02T03:04:05+0000",
+        "like_count": i,
+        "comments_count": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_media_follows_pagination(monkeypatch):
+    calls = []
+    base = {}
+
+    async def handler(request):
+        calls.append(dict(request.query))
+        page = int(request.query.get("page", "0"))
+        items = [_media(page * 25 + i) for i in range(25)]
+        body = {"data": items}
+        if page < 2:
+            body["paging"] = {"next": f"{base['url']}/me/media?page={page + 1}"}
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/me/media", handler)
+    async with TestServer(app) as server:
+        monkeypatch.setenv("INSTAGRAM_ACCESS_TOKEN", "token")
+        svc = InstagramService()
+        base["url"] = svc.base_url = str(server.make_url("")).rstrip("/")
+        try:
+            posts = await svc.get_user_media(max_results=40)
+            cached = await svc.get_user_media(max_results=40)
+        finally:
+            await svc.close()
+
+    assert len(calls) == 2  # 40개를 채우기 위해 두 페이지만 조회 (두 번째 호출은 캐시 사용)
+    assert cached == posts and cached is not posts
+    assert calls[0]["limit"] == "25"
+    assert len(posts) == 40
+    assert posts[0].hashtags == ["#tag0"]
+    assert posts[0].published_at.year == 2024
+
+
+@pytest.mark.asyncio
+async def test_user_media_stops_on_empty_page_with_next(monkeypatch):
+    calls = []
+    base = {}
+
+    async def handler(request):
+        calls.append(dict(request.query))
+        page = int(request.query.get("page", "0"))
+        # 첫 페이지 이후로는 항목 없이 다음 페이지 링크만 계속 내려줌
+        items = [_media(i) for i in range(3)] if page == 0 else []
+        body = {"data": items, "paging": {"next": f"{base['url']}/me/media?page={page + 1}"}}
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/me/media", handler)
+    async with TestServer(app) as server:
+        monkeypatch.setenv("INSTAGRAM_ACCESS_TOKEN", "token")
+        svc = InstagramService()
+        base["url"] = svc.base_url = str(server.make_url("")).rstrip("/")
+        try:
+            posts = await svc.get_user_media(max_results=40)
+        finally:
+            await svc.close()
+
+    assert len(calls) == 2
+    assert [p.id for p in posts] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_user_media_cache_returns_fresh_models(monkeypatch):
+    calls = []
+
+    async def handler(request):
+        calls.append(dict(request.query))
+        return web.json_response({"data": [_media(0), _media(1)]})
+
+    app = web.Application()
+    app.router.add_get("/me/media", handler)
+    async with TestServer(app) as server:
+        monkeypatch.setenv("INSTAGRAM_ACCESS_TOKEN", "token")
+        svc = InstagramService()
+        svc.base_url = str(server.make_url("")).rstrip("/")
+        try:
+            first = await svc.get_user_media(max_results=2)
+            first[0].title = "changed"
+            first[0].hashtags.append("#changed")
+            second = await svc.get_user_media(max_results=2)
+        finally:
+            await svc.close()
+
+    assert len(calls) == 1  # 두 번째 호출은 캐시 사용
+    assert second[0] is not first[0]
+    assert second[0].title == "게시물 0 #Tag0"
+    assert second[0].hashtags == ["#tag0"]
+
+
+def test_convert_media_counts():
+    svc = InstagramService()
+    item = _media(3)
+    assert svc._convert_media_to_trend(item).like_count == 3
+    item.update(like_count="12", comments_count=None)
+    post = svc._convert_media_to_trend(item)
+    assert post.like_count == 12
+    assert post.comment_count is None
@@ -0,0 +1,74 @@
+import pytest
+
+from services.instagram_service import InstagramService
+from services.tiktok_service import TikTokService
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service_cls", [InstagramService, TikTokService])
+async def test_sample_search_fills_query(service_cls):
+    svc = service_cls()
+    results = await svc.search_videos("고양이", max_results=2)
+    assert len(results) == 2
+    assert all("고양이" in r.id and "고양이" in r.title for r in results)
+    assert results[0].hashtags[0] == "#고양이"
+    # 다른 검색어로 호출해도 이전 결과가 바뀌지 않아야 함
+    await svc.search_videos("강아지", max_results=2)
+    assert "고양이" in results[0].url
+    again = await svc.search_videos("고양이", max_results=1)
+    assert again[0] == results[0]
+    # 반환된 결과를 수정해도 캐시된 검색 결과는 그대로 유지
+    results[0].title = "changed"
+    results[0].hashtags.append("#changed")
+    fresh = (await svc.search_videos("고양이", max_results=1))[0]
+    assert fresh.title != "changed"
+    assert "#changed" not in fresh.hashtags
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service_cls", [InstagramService, TikTokService])
+async def test_sample_trends_and_hashtags_slice(service_cls):
+    svc = service_cls()
+    trends = await svc.get_trending_videos(max_results=2)
+    assert len(trends) == 2
+    trends.clear()  # 반환 리스트를 수정해도 다음 호출에 영향이 없어야 함
+    assert len(await svc.get_trending_videos(max_results=2)) == 2
+    hashtags = await svc.get_trending_hashtags(max_results=3)
+    assert [h.trending_score for h in hashtags] == pytest.approx([1.0, 0.9, 0.8])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service_cls", [InstagramService, TikTokService])
+async def test_sample_trends_and_hashtags_are_not_shared(service_cls):
+    svc = service_cls()
+    trends = await svc.get_trending_videos(max_results=1)
+    trends[0].title = "changed"
+    trends[0].hashtags.append("#changed")
+    hashtags = await svc.get_trending_hashtags(max_results=1)
+    hashtags[0].related_hashtags.clear()
+    # 한 호출자의 수정이 다음 호출 결과에 남지 않아야 함
+    fresh = (await svc.get_trending_videos(max_results=1))[0]
+    assert fresh.title != "changed"
+    assert "#changed" not in fresh.hashtags
+    assert (await svc.get_trending_hashtags(max_results=1))[0].related_hashtags
+
+
+@pytest.mark.asyncio
+async def test_instagram_post_aliases():
+    svc = InstagramService()
+    assert InstagramService.get_trending_posts is InstagramService.get_trending_videos
+    assert InstagramService.search_posts is InstagramService.search_videos
+    posts = await svc.get_trending_posts(max_results=1)
+    assert posts[0].platform == "instagram"
+    results = await svc.search_posts("여행", max_results=1)
+    assert "여행" in results[0].title
+
+
+def test_tiktok_headers_are_per_instance(monkeypatch):
+    monkeypatch.setenv("TIKTOK_SESSION_ID", "abc")
+    with_cookie = TikTokService()
+    monkeypatch.delenv("TIKTOK_SESSION_ID")
+    without_cookie = TikTokService()
+    assert with_cookie.headers["Cookie"] == "sessionid=abc"
+    assert "Cookie" not in without_cookie.headers
+    assert "Cookie" not in TikTokService._BASE_HEADERS
@@ -1,9 +1,47 @@
+import asyncio
+import json
 import os
+from datetime import datetime, timedelta, timezone
+from email.parser import FeedParser
+from urllib.parse import parse_qsl, urlsplit
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
+from models.response_models import YouTubeAnalyzeRequest
 from services.youtube_service import YouTubeService
 
 
+def _video(i, channel="UC1"):
+    return {
+        "id": f"v{i}",
+        "snippet": {
+            "title": f"영상 {i} #Tag{i}",
+            "description": "설명",
+            "channelId": channel,
+            "channelTitle": "채널",
+            "publishedAt": "2024-01-02T03:04:05Z",
+            "thumbnails": {"high": {"url": f"https://i.ytimg.com/{i}.jpg"}},
+        },
+        "statistics": {"viewCount": str(i * 100), "likeCount": "1", "commentCount": "2"},
+        "contentDetails": {"duration": "PT1M5S"},
+    }
+
+
+def _service_for(server, monkeypatch, min_interval="0") -> YouTubeService:
+    """API 엔드포인트를 테스트 서버로 돌린 YouTubeService (요청 간격 제한은 기본적으로 끔)"""
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    monkeypatch.setenv("YOUTUBE_MIN_INTERVAL", min_interval)
+    svc = YouTubeService()
+    svc.youtube = build(
+        "youtube", "v3", developerKey="test-key",
+        client_options={"api_endpoint": str(server.make_url("")).rstrip("/")},
+    )
+    return svc
+
+
 @pytest.mark.asyncio
 async def test_youtube_search_smoke():
     svc = YouTubeService()
@@ -21,3 +59,926 @@ async def test_duration_utils():
     assert svc.parse_duration("PT1H2M3S") == "1:02:03"
     assert svc.parse_duration("PT2M5S") == "2:05"
 
+
+@pytest.mark.asyncio
+async def test_trending_videos_use_async_http(monkeypatch):
+    calls = []
+
+    async def handler(request):
+        calls.append(dict(request.query))
+        return web.json_response({"items": [_video(1), _video(2)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", handler)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            trends = await svc.get_trending_videos(region_code="KR", max_results=2)
+        finally:
+            await svc.close()
+
+    assert calls[0]["chart"] == "mostPopular" and calls[0]["key"] == "test-key"
+    assert [t.id for t in trends] == ["v1", "v2"]
+    assert trends[0].view_count == 100
+    assert trends[0].hashtags == ["#tag1"]
+    assert trends[0].url == "https://www.youtube.com/watch?v=v1"
+    assert trends[0].author_url == "https://www.youtube.com/channel/UC1"
+    assert trends[0].thumbnail_url == "https://i.ytimg.com/1.jpg"
+
+
+@pytest.mark.asyncio
+async def test_execute_raises_http_error(monkeypatch):
+    async def handler(request):
+        return web.json_response({"error": {"message": "quota"}}, status=403)
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", handler)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            with pytest.raises(HttpError) as exc:
+                await svc._execute(svc.youtube.channels().list(part="snippet", id="UC1"))
+            with pytest.raises(Exception, match="YouTube API 오류: 403"):
+                await svc.get_channel_info("UC1")
+        finally:
+            await svc.close()
+
+    assert exc.value.resp.status == 403
+
+
+@pytest.mark.asyncio
+async def test_search_videos_requests_only_needed_fields(monkeypatch):
+    calls = []
+
+    async def search(request):
+        calls.append(("search", dict(request.query)))
+        return web.json_response({"items": [{"id": {"videoId": "v1"}}, {"id": {"videoId": "v2"}}]})
+
+    async def videos(request):
+        calls.append(("videos", dict(request.query)))
+        return web.json_response({"items": [_video(1), _video(2)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/search", search)
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            results = await svc.search_videos("검색", max_results=2)
+        finally:
+            await svc.close()
+
+    assert [name for name, _ in calls] == ["search", "videos"]
+    assert calls[0][1]["fields"] == "items/id/videoId"
+    assert calls[1][1]["id"] == "v1,v2"
+    assert "statistics(viewCount,likeCount,commentCount)" in calls[1][1]["fields"]
+    assert calls[1][1]["part"] == "snippet,statistics"
+    assert "contentDetails" not in calls[1][1]["fields"]
+    assert [r.id for r in results] == ["v1", "v2"]
+
+
+@pytest.mark.asyncio
+async def test_trending_and_channel_are_cached(monkeypatch):
+    calls = []
+
+    async def videos(request):
+        calls.append("videos")
+        await asyncio.sleep(0.05)
+        return web.json_response({"items": [_video(1)]})
+
+    async def channels(request):
+        calls.append("channels")
+        return web.json_response({"items": [{
+            "id": "UC1",
+            "snippet": {"title": "채널", "publishedAt": "2020-01-01T00:00:00Z"},
+            "statistics": {"subscriberCount": "10", "videoCount": "3"},
+        }]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    app.router.add_get("/youtube/v3/channels", channels)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            # 동시에 들어온 같은 요청은 한 번의 API 호출로 합쳐진다
+            first, second = await asyncio.gather(svc.get_trending_videos(), svc.get_trending_videos())
+            # 호출 측이 결과를 변경해도 캐시된 다음 결과에는 영향이 없다
+            first[0].hashtags.append("#changed")
+            first[0].title = "변경됨"
+            third = await svc.get_trending_videos()
+            first[0].hashtags.pop()
+            first[0].title = second[0].title
+            other_region = await svc.get_trending_videos(region_code="US")
+            channel = await svc.get_channel_info("UC1")
+            channel_again = await svc.get_channel_info("UC1")
+        finally:
+            await svc.close()
+
+    assert calls == ["videos", "videos", "channels"]
+    assert first == second == third == other_region
+    assert first is not second and first[0] is not second[0] is not third[0]
+    assert channel == channel_again and channel is not channel_again
+    assert channel.follower_count == 10
+    assert not svc._cache_locks and not svc._cache_waiters
+    assert (svc._trending_cache.ttl, svc._channel_cache.ttl) == (300, 3600)
+
+
+@pytest.mark.asyncio
+async def test_cached_keeps_single_flight_after_loader_failure(monkeypatch):
+    from cachetools import TTLCache
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    cache = TTLCache(maxsize=8, ttl=60)
+    state = {"calls": 0, "active": 0, "peak": 0}
+
+    async def loader():
+        state["calls"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        if state["calls"] == 1:
+            raise RuntimeError("first load fails")
+        return "value"
+
+    late = []
+    first = asyncio.create_task(svc._cached(cache, "k", loader))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(svc._cached(cache, "k", loader))
+    # 첫 로더가 실패한 직후(대기 호출이 깨어나는 중)에 새 호출이 들어오는 상황
+    first.add_done_callback(lambda _: late.append(asyncio.ensure_future(svc._cached(cache, "k", loader))))
+    with pytest.raises(RuntimeError):
+        await first
+    assert await waiter == "value"
+    assert await late[0] == "value"
+
+    assert state == {"calls": 2, "active": 0, "peak": 1}
+    assert not svc._cache_locks and not svc._cache_waiters
+
+
+def _batch_handler(sub_handler, posts):
+    """/batch multipart 요청을 하위 GET 요청별로 나누어 처리하는 테스트 핸들러"""
+    async def handler(request):
+        parser = FeedParser()
+        parser.feed(f"content-type: {request.headers['Content-Type']}\r\n\r\n")
+        parser.feed((await request.read()).decode("utf-8"))
+        message = parser.close()
+        posts.append(len(message.get_payload()))
+        boundary = "resp-boundary"
+        out = []
+        for part in message.get_payload():
+            target = urlsplit(part.get_payload().split(" ", 2)[1])
+            status, body = sub_handler(target.path, dict(parse_qsl(target.query)))
+            out.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'].strip('<>')}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n\r\n{json.dumps(body, ensure_ascii=False)}\r\n"
+            )
+        out.append(f"--{boundary}--\r\n")
+        return web.Response(body="".join(out).encode("utf-8"),
+                            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_enrich_coalesces_channel_chunks_into_one_batch(monkeypatch):
+    posts, chunks = [], []
+
+    def channels(path, query):
+        ids = query["id"].split(",")
+        chunks.append(ids)
+        if "UC60" in ids:
+            return 403, {"error": {"message": "할당량 초과"}}
+        return 200, {"items": [
+            {"id": cid, "snippet": {"title": "한글 채널"}, "statistics": {"subscriberCount": "1000"}} for cid in ids
+        ]}
+
+    app = web.Application()
+    app.router.add_post("/batch", _batch_handler(channels, posts))
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        rows = [svc._to_analyze_entry(_video(i, channel=f"UC{i}"))[0] for i in range(1, 61)]
+        try:
+            enriched = await svc._enrich_with_channel_stats(rows)
+        finally:
+            await svc.close()
+
+    # 60개 채널 -> 50 + 10 두 개의 하위 요청을 한 번의 배치 POST로 전송
+    assert posts == [2]
+    assert sorted(len(c) for c in chunks) == [10, 50]
+    failed = {cid for c in chunks if "UC60" in c for cid in c}
+    for row in enriched:
+        if row.channel_id in failed:
+            assert row.subscriber_count is None
+        else:
+            assert row.subscriber_count == 1000
+            assert row.view_to_subscriber_ratio == round(row.view_count / 1000, 2)
+
+
+@pytest.mark.asyncio
+async def test_post_batch_isolates_malformed_sub_responses(monkeypatch):
+    boundary = "resp-boundary"
+
+    def part(content_id, http):
+        header = f"Content-ID: {content_id}\n" if content_id else ""
+        return f"--{boundary}\nContent-Type: application/http\n{header}\n{http}\n"
+
+    # 줄바꿈이 LF뿐인 응답, Content-ID 누락/상태 줄 오류/잘못된 JSON/범위 밖 위치를 섞어서 보냄
+    body = "".join([
+        part("<response-0>", 'HTTP/1.1 200 OK\nContent-Type: application/json\n\n{"items": [{"id": "UC0"}]}'),
+        part(None, 'HTTP/1.1 200 OK\nContent-Type: application/json\n\n{"items": []}'),
+        part("<response-2>", "garbage"),
+        part("<response-3>", "HTTP/1.1 200 OK\nContent-Type: application/json\n\n{not json"),
+        part("<response-4>", 'HTTP/1.1 404 Not Found\nContent-Type: application/json\n\n{"error": {}}'),
+        part("<response-9>", 'HTTP/1.1 200 OK\nContent-Type: application/json\n\n{"items": []}'),
+        f"--{boundary}--\n",
+    ])
+
+    async def handler(request):
+        return web.Response(body=body.encode("utf-8"),
+                            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"})
+
+    app = web.Application()
+    app.router.add_post("/batch", handler)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        requests = [svc.youtube.channels().list(part="statistics", id=f"UC{i}") for i in range(5)]
+        try:
+            results = await svc._post_batch(requests)
+        finally:
+            await svc.close()
+
+    assert results[0] == {"items": [{"id": "UC0"}]}
+    assert [r.resp.status for r in results[1:4]] == [500, 500, 500]
+    assert results[4].resp.status == 404 and results[4].resp["reason"] == "Not Found"
+
+
+@pytest.mark.asyncio
+async def test_execute_retries_rate_limited_requests(monkeypatch):
+    import services.youtube_service as yt
+    monkeypatch.setattr(yt, "_RETRY_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(yt.YouTubeService, "_throttle", yt._ThrottleTelemetry())
+    statuses = [429, 429, 200]
+
+    async def videos(request):
+        status = statuses.pop(0)
+        if status == 429:
+            return web.json_response({"error": {}}, status=429, headers={"Retry-After": "0"})
+        return web.json_response({"items": [_video(1)]})
+
+    async def channels(request):
+        return web.json_response({"error": {}}, status=429)
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    app.router.add_get("/youtube/v3/channels", channels)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            trends = await svc.get_trending_videos(max_results=1)
+            rate_after_recovery = svc._throttle.rate
+            # 재시도 횟수를 넘기면 원래 HttpError를 그대로 전달
+            with pytest.raises(HttpError) as exc:
+                await svc._execute(svc.youtube.channels().list(part="snippet", id="UC1"))
+        finally:
+            await svc.close()
+
+    assert [t.id for t in trends] == ["v1"]
+    assert not statuses
+    assert 0 < rate_after_recovery < svc._throttle.rate
+    assert exc.value.resp.status == 429
+
+
+@pytest.mark.asyncio
+async def test_trending_hashtags_ranked_by_count(monkeypatch):
+    def video(i, title):
+        v = _video(i)
+        v["snippet"]["title"] = title
+        return v
+
+    async def videos(request):
+        return web.json_response({"items": [
+            video(1, "#b #a"), video(2, "#a"), video(3, "#c #b #a"), video(4, "태그 없음"),
+        ]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            hashtags = await svc.get_trending_hashtags(max_results=2)
+        finally:
+            await svc.close()
+
+    assert [(h.hashtag, h.post_count) for h in hashtags] == [("#a", 3), ("#b", 2)]
+    assert hashtags[0].trending_score == 0.75
+
+
+@pytest.mark.asyncio
+async def test_channel_info_shared_across_processes(monkeypatch, tmp_path):
+    calls = []
+
+    async def channels(request):
+        calls.append(request.query["id"])
+        return web.json_response({"items": [{
+            "id": "UC1",
+            "snippet": {"title": "채널", "publishedAt": "2020-01-01T00:00:00Z"},
+            "statistics": {"subscriberCount": "10", "videoCount": "3"},
+        }]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", channels)
+    monkeypatch.setenv("YOUTUBE_CACHE_DB", str(tmp_path / "cache.db"))
+    async with TestServer(app) as server:
+        # 메모리 캐시가 비어 있는 두 인스턴스(다른 워커 프로세스 가정)가 같은 파일을 공유
+        first_worker = _service_for(server, monkeypatch)
+        second_worker = _service_for(server, monkeypatch)
+        try:
+            first = await first_worker.get_channel_info("UC1")
+            second = await second_worker.get_channel_info("UC1")
+        finally:
+            await first_worker.close()
+            await second_worker.close()
+
+    assert calls == ["UC1"]
+    assert second == first
+    assert second.created_at == first.created_at
+
+
+@pytest.mark.asyncio
+async def test_iter_trending_videos_streams_conversions(monkeypatch):
+    calls = []
+
+    async def videos(request):
+        calls.append(request.query["regionCode"])
+        broken = {"id": "broken", "snippet": None}
+        return web.json_response({"items": [_video(1), broken, _video(2)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            streamed = [t.id async for t in svc.iter_trending_videos(region_code="US")]
+            # 스트리밍 조회가 채운 원본 캐시를 목록 조회도 재사용한다
+            listed = await svc.get_trending_videos(region_code="US")
+            cached = [t.id async for t in svc.iter_trending_videos(region_code="US")]
+        finally:
+            await svc.close()
+
+    assert streamed == [t.id for t in listed] == cached == ["v1", "v2"]
+    assert calls == ["US"]
+
+
+@pytest.mark.asyncio
+async def test_channel_fetch_does_not_block_event_loop(monkeypatch):
+    async def search(request):
+        assert request.query["channelId"] == "UC1"
+        return web.json_response({"items": [{"id": {"videoId": "v1"}}]})
+
+    async def videos(request):
+        return web.json_response({"items": [_video(1)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/search", search)
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        # 같은 이벤트 루프의 테스트 서버가 응답해야 하므로 루프를 막으면 완료되지 않는다
+        items = await asyncio.wait_for(
+            svc._fetch_recent_videos_by_channel("UC1", max_results=5, region_code="KR"), timeout=10
+        )
+        await svc.close()
+
+    assert [v["id"] for v in items] == ["v1"]
+
+
+def test_common_fields_reused_per_etag(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    built = []
+    original = svc._build_common
+    monkeypatch.setattr(svc, "_build_common", lambda video: built.append(video["id"]) or original(video))
+
+    video = dict(_video(1), etag="e1")
+    trend = svc._convert_video_to_trend(video)
+    search = svc._convert_video_to_search(video)
+    trend.hashtags.append("#changed")
+    assert built == ["v1"]
+    assert search.hashtags == ["#tag1"]
+    assert svc._convert_video_to_search(video).hashtags == ["#tag1"]
+    assert (search.url, search.view_count) == (trend.url, trend.view_count)
+    assert trend.duration == "1:05"
+
+    # etag가 바뀌면 다시 계산
+    updated = dict(_video(1), etag="e2")
+    updated["statistics"] = {"viewCount": "999"}
+    assert svc._convert_video_to_search(updated).view_count == 999
+    assert built == ["v1", "v1"]
+
+
+@pytest.mark.asyncio
+async def test_youtube_session_reuses_tuned_pool(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    try:
+        session = svc.get_session()
+        assert svc.get_session() is session
+        assert session.connector.limit_per_host == 20
+    finally:
+        await svc.close()
+
+
+@pytest.mark.asyncio
+async def test_outbound_calls_respect_concurrency_limit(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_MAX_CONCURRENCY", "2")
+    state = {"active": 0, "peak": 0}
+
+    async def channels(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return web.json_response({"items": []})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", channels)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            await asyncio.gather(*(
+                svc._execute(svc.youtube.channels().list(part="statistics", id=f"UC{i}")) for i in range(6)
+            ))
+        finally:
+            await svc.close()
+
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_time_out_and_retry(monkeypatch):
+    import services.youtube_service as yt
+    monkeypatch.setattr(yt, "_RETRY_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(yt.YouTubeService, "_throttle", yt._ThrottleTelemetry())
+    monkeypatch.setenv("YT_TIMEOUT", "0.1")
+    delays = [1.0, 0.0]
+
+    async def channels(request):
+        await asyncio.sleep(delays.pop(0) if delays else 1.0)
+        return web.json_response({"items": []})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", channels)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            # 첫 시도는 시간 초과로 취소되고 재시도에서 성공
+            assert await svc._execute(svc.youtube.channels().list(part="id", id="UC1")) == {"items": []}
+            assert svc._throttle.rate > 0
+            # 모든 시도가 지연되면 TimeoutError 전달
+            with pytest.raises(asyncio.TimeoutError):
+                await svc._execute(svc.youtube.channels().list(part="id", id="UC2"))
+        finally:
+            await svc.close()
+
+
+def _analyze_app(state):
+    """analyze 흐름(핸들 해석 -> 채널/키워드 검색 -> 상세 -> 구독자)을 흉내 내는 테스트 API"""
+    recent = (datetime.now(timezone.utc) - timedelta(hours=10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def video(vid, channel):
+        v = _video(0, channel=channel)
+        v["id"] = vid
+        v["snippet"]["publishedAt"] = recent
+        v["statistics"]["viewCount"] = "100000"
+        return v
+
+    async def search(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        state["search"].append(dict(request.query))
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        query = request.query
+        if query.get("type") == "channel":
+            handle = query["q"].lstrip("@")
+            if handle == "missing":
+                return web.json_response({"items": []})
+            return web.json_response({"items": [{"snippet": {"channelId": f"UC_{handle}"}}]})
+        prefix = query.get("channelId") or query["q"]
+        return web.json_response({"items": [{"id": {"videoId": f"{prefix}-{i}"}} for i in range(2)]})
+
+    async def videos(request):
+        state["videos"].append(dict(request.query))
+        items = []
+        for vid in request.query["id"].split(","):
+            owner = vid.rsplit("-", 1)[0]
+            items.append(video(vid, owner if owner.startswith("UC_") else "UC_search"))
+        return web.json_response({"items": items})
+
+    async def channels(request):
+        state["channels"].append(request.query["id"])
+        return web.json_response({"items": [
+            {"id": cid, "statistics": {"subscriberCount": "1000"}} for cid in request.query["id"].split(",")
+        ]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/search", search)
+    app.router.add_get("/youtube/v3/videos", videos)
+    app.router.add_get("/youtube/v3/channels", channels)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_analyze_collects_handles_and_keywords_concurrently(monkeypatch):
+    state = {"active": 0, "peak": 0, "search": [], "videos": [], "channels": []}
+    async with TestServer(_analyze_app(state)) as server:
+        svc = _service_for(server, monkeypatch)
+        req = YouTubeAnalyzeRequest(
+            mode="both", channel_handles=["@alpha", "missing"], keywords=["뉴스", "게임"],
+            min_view_count=1000, min_views_per_hour=10,
+        )
+        try:
+            res = await svc.analyze(req)
+        finally:
+            await svc.close()
+
+    assert state["peak"] > 1
+    # 실패한 핸들은 건너뛰고, 결과는 요청 순서(채널 -> 키워드)대로 합쳐진다
+    assert [r.video_id for r in res.rows] == [
+        "UC_alpha-0", "UC_alpha-1", "뉴스-0", "뉴스-1", "게임-0", "게임-1",
+    ]
+    assert res.total == res.filtered == 6
+    assert res.rows[0].subscriber_count == 1000
+
+
+@pytest.mark.asyncio
+async def test_analyze_reuses_resolved_handles(monkeypatch):
+    state = {"active": 0, "peak": 0, "search": [], "videos": [], "channels": []}
+    async with TestServer(_analyze_app(state)) as server:
+        svc = _service_for(server, monkeypatch)
+        req = YouTubeAnalyzeRequest(mode="channel", channel_handles=["@alpha"], min_view_count=0, min_views_per_hour=0)
+        try:
+            first = await svc.analyze(req)
+            second = await svc.analyze(req)
+        finally:
+            await svc.close()
+
+    handle_lookups = [q for q in state["search"] if q.get("type") == "channel"]
+    assert len(handle_lookups) == 1
+    assert [r.video_id for r in first.rows] == [r.video_id for r in second.rows]
+
+
+def test_form_filter_uses_parsed_duration_seconds(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+
+    def row(vid, duration):
+        v = _video(0)
+        v["id"] = vid
+        v["snippet"]["publishedAt"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        v["contentDetails"]["duration"] = duration
+        return svc._to_analyze_entry(v)
+
+    entries = [
+        row("short", "PT45S"), row("long", "PT1H2M3S"), row("edge", "PT3M"),
+        row("stream", "P1DT2H3M"), row("days", "P2D"),
+    ]
+    assert [r.duration for r, _, _ in entries] == ["0:45", "1:02:03", "3:00", "26:03:00", "48:00:00"]
+    assert [seconds for _, _, seconds in entries] == [45, 3723, 180, 93780, 172800]
+
+    shorts = list(svc._iter_by_time_and_form(entries, timeframe_days=30, form="shorts", shorts_threshold=180))
+    long_form = list(svc._iter_by_time_and_form(entries, timeframe_days=30, form="long", shorts_threshold=180))
+    assert [r.video_id for r in shorts] == ["short", "edge"]
+    assert [r.video_id for r in long_form] == ["long", "stream", "days"]
+
+
+@pytest.mark.asyncio
+async def test_enrich_sends_oversized_batches_concurrently(monkeypatch):
+    posts, state = [], {"active": 0, "peak": 0}
+
+    def channels(path, query):
+        return 200, {"items": [{"id": cid, "statistics": {"subscriberCount": "5"}} for cid in query["id"].split(",")]}
+
+    inner = _batch_handler(channels, posts)
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        try:
+            return await inner(request)
+        finally:
+            state["active"] -= 1
+
+    app = web.Application()
+    app.router.add_post("/batch", handler)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        # 51개 청크(2550개 채널) -> 하위 요청 50개 + 1개, 두 배치를 동시에 전송
+        rows = [svc._to_analyze_entry(_video(i, channel=f"UC{i}"))[0] for i in range(2550)]
+        try:
+            enriched = await svc._enrich_with_channel_stats(rows)
+        finally:
+            await svc.close()
+
+    assert sorted(posts) == [1, 50]
+    assert state["peak"] == 2
+    assert all(r.subscriber_count == 5 for r in enriched)
+
+
+def test_views_per_hour_uses_epoch_seconds(monkeypatch):
+    import services.youtube_service as yt
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    published = datetime(2024, 1, 2, 3, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(yt.time, "time", lambda: published.timestamp() + 4 * 3600)
+
+    v = _video(1)
+    v["snippet"]["publishedAt"] = "2024-01-02T03:00:00Z"
+    v["statistics"]["viewCount"] = "1000"
+    row, published_ts, _ = svc._to_analyze_entry(v)
+    assert row.views_per_hour == 250.0
+    assert published_ts == published.timestamp()
+
+
+@pytest.mark.asyncio
+async def test_trending_hashtags_share_raw_trending_fetch(monkeypatch):
+    calls = []
+
+    async def videos(request):
+        calls.append(request.query.get("maxResults"))
+        return web.json_response({"items": [_video(1), _video(2)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            hashtags = await svc.get_trending_hashtags()
+            trends = await svc.get_trending_videos(max_results=50)
+        finally:
+            await svc.close()
+
+    assert calls == ["50"]
+    assert sorted(h.hashtag for h in hashtags) == ["#tag1", "#tag2"]
+    assert [t.hashtags for t in trends] == [["#tag1"], ["#tag2"]]
+
+
+def test_video_hashtags_deduplicated_in_order():
+    svc = YouTubeService()
+    video = _video(1)
+    video["snippet"]["description"] = "#B 설명 #a #b"
+    video["snippet"]["title"] = "#A 제목 #c"
+    assert svc._video_hashtags(video) == ["#b", "#a", "#c"]
+    assert svc._convert_video_to_trend(video).hashtags == ["#b", "#a", "#c"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_skips_channel_stats_for_rows_below_thresholds(monkeypatch):
+    state = {"active": 0, "peak": 0, "search": [], "videos": [], "channels": []}
+    async with TestServer(_analyze_app(state)) as server:
+        svc = _service_for(server, monkeypatch)
+        req = YouTubeAnalyzeRequest(mode="keyword", keywords=["뉴스"], min_view_count=10 ** 9)
+        try:
+            res = await svc.analyze(req)
+        finally:
+            await svc.close()
+
+    # 기간/폼 조건은 통과했지만 최소 조회수에 못 미쳐 구독자 조회 대상이 없다
+    assert (res.total, res.filtered) == (2, 0)
+    assert state["channels"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_videos_deduplicates_video_ids(monkeypatch):
+    requested = []
+
+    async def search(request):
+        return web.json_response({"items": [
+            {"id": {"videoId": "v2"}}, {"id": {"videoId": "v1"}}, {"id": {"videoId": "v2"}}, {"id": {}},
+        ]})
+
+    async def videos(request):
+        requested.append(request.query["id"])
+        return web.json_response({"items": [_video(2), _video(1)]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/search", search)
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            results = await svc.search_videos("검색", order="date")
+        finally:
+            await svc.close()
+
+    assert requested == ["v2,v1"]
+    assert [r.id for r in results] == ["v2", "v1"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_keyword_rows_hydrated_with_details(monkeypatch):
+    state = {"active": 0, "peak": 0, "search": [], "videos": [], "channels": []}
+    async with TestServer(_analyze_app(state)) as server:
+        svc = _service_for(server, monkeypatch)
+        req = YouTubeAnalyzeRequest(mode="keyword", keywords=["뉴스"], min_view_count=0, min_views_per_hour=0)
+        try:
+            res = await svc.analyze(req)
+        finally:
+            await svc.close()
+
+    # 검색 1회 + 상세 1회로 길이/채널 ID/조회수를 채우고, 구독자 보강까지 이어진다
+    assert len(state["search"]) == len(state["videos"]) == 1
+    assert "contentDetails" in state["videos"][0]["part"]
+    assert [(r.channel_id, r.duration, r.view_count, r.subscriber_count) for r in res.rows] == [
+        ("UC_search", "1:05", 100000, 1000),
+    ] * 2
+    assert state["channels"] == ["UC_search"]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_counts_cached_in_memory_and_shared_store(monkeypatch, tmp_path):
+    calls = []
+
+    async def channels(request):
+        ids = request.query["id"].split(",")
+        calls.append(ids)
+        return web.json_response({"items": [
+            {"id": cid, "statistics": {"subscriberCount": "500"} if cid != "UC_hidden" else {}} for cid in ids
+        ]})
+
+    def row(vid, channel):
+        return YouTubeService()._to_analyze_entry(_video(vid, channel=channel))[0]
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", channels)
+    monkeypatch.setenv("YOUTUBE_CACHE_DB", str(tmp_path / "cache.db"))
+    async with TestServer(app) as server:
+        first_worker = _service_for(server, monkeypatch)
+        second_worker = _service_for(server, monkeypatch)
+        try:
+            first = await first_worker._enrich_with_channel_stats([row(1, "UC1"), row(2, "UC_hidden")])
+            # 같은 인스턴스는 메모리 캐시, 다른 워커는 공유 캐시를 사용하고 새 채널만 조회
+            again = await first_worker._enrich_with_channel_stats([row(3, "UC1")])
+            other = await second_worker._enrich_with_channel_stats([row(4, "UC1"), row(5, "UC2")])
+        finally:
+            await first_worker.close()
+            await second_worker.close()
+
+    assert sorted(map(sorted, calls)) == [["UC1", "UC_hidden"], ["UC2"]]
+    assert [(r.subscriber_count, r.view_to_subscriber_ratio) for r in first] == [(500, 0.2), (None, None)]
+    assert again[0].subscriber_count == 500
+    assert [r.subscriber_count for r in other] == [500, 500]
+
+
+@pytest.mark.asyncio
+async def test_trending_hashtags_empty_when_trending_fails(monkeypatch):
+    async def videos(request):
+        return web.json_response({"error": {"message": "forbidden"}}, status=403)
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        try:
+            hashtags = await svc.get_trending_hashtags()
+        finally:
+            await svc.close()
+
+    assert hashtags == []
+
+
+def test_analyze_rows_share_reference_time(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    published = datetime(2024, 1, 2, 3, 0, 0, tzinfo=timezone.utc).timestamp()
+
+    v = _video(1)
+    v["snippet"]["publishedAt"] = "2024-01-02T03:00:00Z"
+    v["statistics"]["viewCount"] = "1000"
+    entry = svc._to_analyze_entry(v, now_ts=published + 2 * 3600)
+    assert entry[0].views_per_hour == 500.0
+
+    # 같은 기준 시각으로 기간 필터도 평가한다
+    assert list(svc._iter_by_time_and_form([entry], 1, "both", 60, now_ts=published + 2 * 86400)) == []
+    assert list(svc._iter_by_time_and_form([entry], 1, "both", 60, now_ts=published + 3600)) == [entry[0]]
+
+
+@pytest.mark.asyncio
+async def test_requests_paced_by_min_interval(monkeypatch):
+    started = []
+
+    async def videos(request):
+        started.append(asyncio.get_running_loop().time())
+        return web.json_response({"items": []})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch, min_interval="0.1")
+        try:
+            await asyncio.gather(*(
+                svc._execute(svc.youtube.videos().list(part="id", id=f"v{i}")) for i in range(4)
+            ))
+        finally:
+            await svc.close()
+
+    gaps = [b - a for a, b in zip(sorted(started), sorted(started)[1:])]
+    assert len(gaps) == 3
+    assert min(gaps) >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_pacing_does_not_hold_a_concurrency_slot(monkeypatch):
+    async def videos(request):
+        return web.json_response({"items": []})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/videos", videos)
+    async with TestServer(app) as server:
+        monkeypatch.setenv("YOUTUBE_MAX_CONCURRENCY", "1")
+        svc = _service_for(server, monkeypatch, min_interval="0.05")
+        held_while_pacing = []
+        pace = svc._pace
+
+        async def recording_pace():
+            held_while_pacing.append(svc._request_semaphore.locked())
+            await pace()
+
+        svc._pace = recording_pace
+        try:
+            await asyncio.gather(*(
+                svc._execute(svc.youtube.videos().list(part="id", id=f"v{i}")) for i in range(2)
+            ))
+        finally:
+            await svc.close()
+
+    # 간격 대기는 슬롯을 잡기 전에 하므로 먼저 시작한 요청은 비어 있는 슬롯에서 대기한다
+    assert held_while_pacing[0] is False
+    assert len(held_while_pacing) == 2
+
+
+def test_batch_uri_follows_discovery_batch_path(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    # googleapiclient BatchHttpRequest와 같은 실제 배치 엔드포인트
+    assert svc._batch_uri() == "https://youtube.googleapis.com/batch"
+    assert svc._batch_uri() == svc.youtube.new_batch_http_request()._batch_uri
+
+
+@pytest.mark.asyncio
+async def test_locked_shared_cache_does_not_block_event_loop(monkeypatch, tmp_path):
+    import sqlite3
+
+    async def channels(request):
+        return web.json_response({"items": [{"id": "UC1", "snippet": {"title": "채널"}, "statistics": {}}]})
+
+    app = web.Application()
+    app.router.add_get("/youtube/v3/channels", channels)
+    db = tmp_path / "cache.db"
+    monkeypatch.setenv("YOUTUBE_CACHE_DB", str(db))
+    async with TestServer(app) as server:
+        svc = _service_for(server, monkeypatch)
+        svc._store.get("warmup")  # 테이블 생성
+        # 다른 워커가 쓰기 잠금을 잡고 있는 상황
+        locker = sqlite3.connect(db)
+        locker.execute("BEGIN EXCLUSIVE")
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(asyncio.get_running_loop().time())
+                await asyncio.sleep(0.05)
+
+        try:
+            info, _ = await asyncio.gather(svc.get_channel_info("UC1"), ticker())
+        finally:
+            locker.rollback()
+            locker.close()
+            await svc.close()
+
+    # 잠금 대기 중에도 다른 작업이 제때 실행되고, 캐시를 건너뛰고 API 결과를 반환
+    assert info.name == "채널"
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.5
+
+
+@pytest.mark.asyncio
+async def test_trending_hashtags_without_client_is_quiet(monkeypatch, caplog):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    svc = YouTubeService()
+    svc.youtube = None
+    caplog.clear()
+    with caplog.at_level("ERROR"):
+        assert await svc.get_trending_hashtags() == []
+    assert not caplog.records
+
+
+def test_min_interval_defaults_to_150ms(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    monkeypatch.delenv("YOUTUBE_MIN_INTERVAL", raising=False)
+    assert YouTubeService()._min_interval == 0.15
+    monkeypatch.setenv("YOUTUBE_MIN_INTERVAL", "0")
+    assert YouTubeService()._min_interval == 0.0